@@ -24,7 +24,7 @@ from __future__ import annotations
 import asyncio
 import logging
 from dataclasses import dataclass, field
-from enum import Enum
+from enum import StrEnum
 from typing import TYPE_CHECKING, Any
 
 # Import types from runtime - single source of truth
@@ -42,7 +42,7 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
-class ConnectionMode(str, Enum):
+class ConnectionMode(StrEnum):
     """How we connect to the runtime."""
 
     SUBPROCESS = "subprocess"  # Launch runtime as subprocess (stdio)
@@ -331,6 +331,7 @@ class RuntimeBridge:
             logger.error(f"Error processing prompt: {e}")
             self.app.add_error(f"Error: {e}")
         finally:
+            self._router.flush_content()
             self.app.end_response()
             self.app.set_busy(False)
 
@@ -345,6 +346,10 @@ class RuntimeBridge:
 
         logger.debug(f"Event: {event_type} - {data}")
 
+        # Tool events below render directly, so push out any buffered text first
+        if not self._router.content.handles(event_type):
+            self._router.flush_content()
+
         # Special handling for tool events - we need to track UI block IDs
         if event_type in ("tool_call", "tool_call_start", "tool.start", "tool:pre"):
             self._handle_tool_call_start(data)
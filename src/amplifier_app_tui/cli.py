@@ -280,6 +280,18 @@ def _load_config() -> dict | None:
     return None
 
 
+def _install_event_loop_policy() -> None:
+    """Use uvloop for the asyncio event loop when it is installed."""
+    try:
+        import uvloop
+    except ImportError:
+        return  # Stock asyncio loop
+
+    import asyncio
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
 def _run_with_config() -> None:
     """Run TUI with configured settings."""
     config = _load_config()
@@ -311,6 +323,8 @@ def _run_with_options(
     """Run TUI with explicit options."""
     from .app import run
 
+    _install_event_loop_policy()
+
     run(
         attach_url=attach_url,
         runtime_command=[runtime_command] if runtime_command else None,
@@ -325,6 +339,7 @@ def _run_mock() -> None:
 
     from .app import AmplifierTUI
 
+    _install_event_loop_policy()
     app = AmplifierTUI()
 
     async def demo_sequence():
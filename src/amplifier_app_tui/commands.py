@@ -112,6 +112,26 @@ class Command:
         return cls(name=name, subcommand=subcommand, args=args, flags=flags)
 
 
+# Box templates for /tools and /status - only the variable rows are formatted
+_TOOLS_HEADER = "╭─ Available Tools ─────────────────────────────────────────────╮\n"
+_TOOLS_ROW = "│  • %-58s │"
+_TOOLS_FOOTER = (
+    "\n├────────────────────────────────────────────────────────────────┤\n"
+    "│  Total: %d tools                                            │\n"
+    "╰────────────────────────────────────────────────────────────────╯"
+)
+_STATUS_TEMPLATE = (
+    "╭─ Session Status ──────────────────────────────────────────────╮\n"
+    "│  Session ID: %-48s │\n"
+    "│  State:      %-48s │\n"
+    "│  Bundle:     %-48s │\n"
+    "│  Messages:   %-48s │\n"
+    "%s"
+    "╰────────────────────────────────────────────────────────────────╯"
+)
+_STATUS_CREATED_ROW = "│  Created:    %-48s │\n"
+
+
 class CommandHandler:
     """Handles slash command execution."""
 
@@ -802,26 +822,17 @@ class CommandHandler:
                     message="No tools available in current session.",
                 )
 
-            lines = [
-                "╭─ Available Tools ─────────────────────────────────────────────╮",
+            names = [
+                tool if isinstance(tool, str) else tool.get("name", tool.get("module", "unknown"))
+                for tool in tools
+                if isinstance(tool, str | dict)
             ]
-
-            for tool in tools:
-                if isinstance(tool, str):
-                    lines.append(f"│  • {tool:<58} │")
-                elif isinstance(tool, dict):
-                    name = tool.get("name", tool.get("module", "unknown"))
-                    lines.append(f"│  • {name:<58} │")
-
-            lines.append("├────────────────────────────────────────────────────────────────┤")
-            lines.append(
-                f"│  Total: {len(tools)} tools                                            │"
-            )
-            lines.append("╰────────────────────────────────────────────────────────────────╯")
+            body = "\n".join([_TOOLS_ROW % name for name in names])
+            message = _TOOLS_HEADER + body + _TOOLS_FOOTER % len(tools)
 
             return CommandResponse(
                 result=CommandResult.SUCCESS,
-                message="\n".join(lines),
+                message=message,
                 data={"tools": tools},
             )
         except Exception as e:
@@ -842,22 +853,18 @@ class CommandHandler:
 
             info = await self.bridge._client.session.info(session_id)
 
-            lines = [
-                "╭─ Session Status ──────────────────────────────────────────────╮",
-                f"│  Session ID: {session_id:<48} │",
-                f"│  State:      {info.get('state', 'unknown'):<48} │",
-                f"│  Bundle:     {info.get('bundle', 'N/A'):<48} │",
-                f"│  Messages:   {info.get('message_count', 0):<48} │",
-            ]
-
-            if info.get("created_at"):
-                lines.append(f"│  Created:    {info.get('created_at', ''):<48} │")
-
-            lines.append("╰────────────────────────────────────────────────────────────────╯")
+            created_at = info.get("created_at")
+            message = _STATUS_TEMPLATE % (
+                session_id,
+                info.get("state", "unknown"),
+                info.get("bundle", "N/A"),
+                info.get("message_count", 0),
+                _STATUS_CREATED_ROW % created_at if created_at else "",
+            )
 
             return CommandResponse(
                 result=CommandResult.SUCCESS,
-                message="\n".join(lines),
+                message=message,
                 data=info,
             )
         except Exception as e:
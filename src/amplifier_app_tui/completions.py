@@ -10,7 +10,11 @@ Uses textual-autocomplete for the dropdown UI.
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import bisect
+import functools
+import heapq
+import time
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 from textual.content import Content
@@ -20,14 +24,14 @@ if TYPE_CHECKING:
     from .bridge import RuntimeBridge
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CommandInfo:
     """Information about a command for completion."""
 
     name: str
     description: str
     category: str = "command"  # command, subcommand, flag
-    aliases: list[str] = field(default_factory=list)
+    aliases: tuple[str, ...] = ()
 
 
 # Built-in commands with descriptions
@@ -35,12 +39,12 @@ COMMANDS: dict[str, CommandInfo] = {
     "/help": CommandInfo(
         name="/help",
         description="Show help information",
-        aliases=["/h", "/?"],
+        aliases=("/h", "/?"),
     ),
     "/bundle": CommandInfo(
         name="/bundle",
         description="Manage bundles",
-        aliases=["/b"],
+        aliases=("/b",),
     ),
     "/bundle list": CommandInfo(
         name="/bundle list",
@@ -91,7 +95,7 @@ COMMANDS: dict[str, CommandInfo] = {
     "/quit": CommandInfo(
         name="/quit",
         description="Exit the application",
-        aliases=["/exit", "/q"],
+        aliases=("/exit", "/q"),
     ),
     "/mode": CommandInfo(
         name="/mode",
@@ -113,6 +117,90 @@ CATEGORY_ICONS = {
     "bundle": "📦",
 }
 
+# Pre-parsed dropdown prefixes (markup is parsed once, not per keystroke)
+_PREFIX_AGENT = Content.from_markup(f"[bold cyan]{CATEGORY_ICONS['agent']}[/] ")
+_PREFIX_TOOL = Content.from_markup(f"[bold yellow]{CATEGORY_ICONS['tool']}[/] ")
+_PREFIX_CMD = Content.from_markup(f"[bold green]{CATEGORY_ICONS['command']}[/] ")
+_PREFIX_SUBCMD = Content.from_markup(f"[dim]{CATEGORY_ICONS['subcommand']}[/] ")
+_PREFIX_FLAG = Content.from_markup(f"[bold green]{CATEGORY_ICONS['flag']}[/] ")
+_COMMAND_PREFIXES: dict[str, Content] = {
+    "command": _PREFIX_CMD,
+    "subcommand": _PREFIX_SUBCMD,
+    "flag": _PREFIX_FLAG,
+}
+
+
+def _build_command_item(cmd_info: CommandInfo) -> DropdownItem:
+    """Create a DropdownItem for a command.
+
+    IMPORTANT: main text is what gets inserted on Tab.
+    Display: icon + command + description (but only command is inserted)
+    """
+    # Style based on category
+    prefix = _COMMAND_PREFIXES.get(cmd_info.category, _PREFIX_CMD)
+
+    # Main shows: "command  description" but value is extracted as just command
+    # We use a custom format where main has command padded, then dim description
+    padded_cmd = f"{cmd_info.name:<20}"
+    main_display = f"{padded_cmd} [dim]{cmd_info.description}[/dim]"
+
+    return DropdownItem(
+        main=Content.from_markup(main_display),
+        prefix=prefix,
+        id=cmd_info.name,  # Store actual command in id for potential use
+    )
+
+
+# Pre-built dropdown items, one per command (COMMANDS is static)
+_COMMAND_ITEMS: dict[str, DropdownItem] = {
+    name: _build_command_item(info) for name, info in COMMANDS.items()
+}
+
+# Sorted lowercase command names + aliases for bisect prefix lookup
+_NAME_TO_INFO: dict[str, CommandInfo] = {}
+for _info in COMMANDS.values():
+    _NAME_TO_INFO[_info.name.lower()] = _info
+    for _alias in _info.aliases:
+        _NAME_TO_INFO.setdefault(_alias.lower(), _info)
+_SORTED_NAMES_LOWER: list[str] = sorted(_NAME_TO_INFO)
+
+# Seconds before cached agent/tool lists are re-fetched from the bridge
+_CACHE_TTL = 5.0
+
+# Most common commands, shown when input is empty (discovery mode)
+_DISCOVERY_ITEMS: list[DropdownItem] = [
+    _COMMAND_ITEMS[name]
+    for name in ("/help", "/bundle", "/reset", "/clear", "/quit")
+    if name in _COMMAND_ITEMS
+]
+
+
+@functools.lru_cache(maxsize=256)
+def _agent_item(agent: str) -> DropdownItem:
+    """Create (and cache) the DropdownItem for an agent.
+
+    Display: icon + @agent + (bundle)
+    Insert on Tab: just @agent (via SmartAutoComplete using id field)
+    """
+    # Parse agent name for display
+    if ":" in agent:
+        bundle, _name = agent.split(":", 1)
+        description = f"({bundle})"
+    else:
+        description = ""
+
+    # What gets inserted on Tab
+    completion_value = f"@{agent}"
+
+    # Display: @agent:name  (bundle) - padded for alignment
+    display = f"{completion_value:<35} [dim]{description}[/dim]"
+
+    return DropdownItem(
+        main=Content.from_markup(display),
+        prefix=_PREFIX_AGENT,
+        id=completion_value,  # SmartAutoComplete uses this for insertion
+    )
+
 
 class CompletionProvider:
     """Provides completion items for the autocomplete dropdown.
@@ -128,6 +216,11 @@ class CompletionProvider:
         self._cached_agents: list[str] | None = None
         self._cached_tools: list[str] | None = None
         self._cached_bundles: list[str] | None = None
+        self._cached_agents_at = 0.0
+        self._cached_tools_at = 0.0
+        # Bridge capability probes (None = not probed yet)
+        self._bridge_has_agents: bool | None = None
+        self._bridge_has_tools: bool | None = None
 
     def set_bridge(self, bridge: RuntimeBridge) -> None:
         """Set the runtime bridge for dynamic completions."""
@@ -136,6 +229,8 @@ class CompletionProvider:
         self._cached_agents = None
         self._cached_tools = None
         self._cached_bundles = None
+        self._bridge_has_agents = None
+        self._bridge_has_tools = None
 
     def get_candidates(self, state: TargetState) -> list[DropdownItem]:
         """Get completion candidates based on current input.
@@ -149,36 +244,40 @@ class CompletionProvider:
             List of DropdownItem for the dropdown menu
         """
         text = state.text.strip()
+        if not text:
+            # Empty input - show common commands
+            return self._get_discovery_items()
 
-        # Determine completion context
-        if text.startswith("/"):
+        # Determine completion context from the first character
+        first = text[0]
+        if first == "/":
             return self._get_command_completions(text)
-        elif text.startswith("@"):
+        elif first == "@":
             return self._get_agent_completions(text)
         elif "tool-" in text.lower():
             return self._get_tool_completions(text)
-        elif not text:
-            # Empty input - show common commands
-            return self._get_discovery_items()
 
         return []
 
     def _get_command_completions(self, text: str) -> list[DropdownItem]:
-        """Get command completions for /commands."""
-        items: list[tuple[str, DropdownItem]] = []  # (sort_key, item)
-        text_lower = text.lower()
+        """Get command completions for /commands.
 
-        for cmd_name, cmd_info in COMMANDS.items():
-            # Check if input matches command or aliases
-            if cmd_name.lower().startswith(text_lower):
-                items.append((cmd_name, self._make_command_item(cmd_info)))
-            elif any(alias.lower().startswith(text_lower) for alias in cmd_info.aliases):
-                items.append((cmd_name, self._make_command_item(cmd_info)))
+        Bisects into the sorted name/alias list and walks the prefix range,
+        so each keystroke costs O(log N + k) instead of a full scan.
+        """
+        text_lower = text.lower()
+        matches: dict[str, bool] = {}  # cmd name -> matched by its own name
 
-        # Sort: exact prefix matches first, then by name
-        items.sort(key=lambda x: (not x[0].lower().startswith(text_lower), x[0]))
+        lo = bisect.bisect_left(_SORTED_NAMES_LOWER, text_lower)
+        while lo < len(_SORTED_NAMES_LOWER) and _SORTED_NAMES_LOWER[lo].startswith(text_lower):
+            cmd_name = _NAME_TO_INFO[_SORTED_NAMES_LOWER[lo]].name
+            if cmd_name not in matches:
+                matches[cmd_name] = cmd_name.lower().startswith(text_lower)
+            lo += 1
 
-        return [item for _, item in items[:10]]  # Limit to 10 items
+        # Sort: name matches before alias-only matches, then by name
+        ordered = sorted(matches, key=lambda name: (not matches[name], name))
+        return [_COMMAND_ITEMS[name] for name in ordered[:10]]  # Limit to 10 items
 
     def _get_agent_completions(self, text: str) -> list[DropdownItem]:
         """Get agent completions for @mentions.
@@ -190,40 +289,12 @@ class CompletionProvider:
         items = []
         search = text[1:].lower() if text.startswith("@") else text.lower()
 
-        for agent in agents:
-            agent_lower = agent.lower()
-            if search in agent_lower or not search:
-                # Parse agent name for display
-                if ":" in agent:
-                    bundle, _name = agent.split(":", 1)
-                    description = f"({bundle})"
-                else:
-                    description = ""
-
-                icon = CATEGORY_ICONS["agent"]
-                prefix = Content.from_markup(f"[bold cyan]{icon}[/] ")
-
-                # What gets inserted on Tab
-                completion_value = f"@{agent}"
-
-                # Display: @agent:name  (bundle) - padded for alignment
-                display = f"{completion_value:<35} [dim]{description}[/dim]"
+        # Pick the best 10 matches before building any dropdown items
+        matches = [agent for agent in agents if not search or search in agent.lower()]
+        for agent in heapq.nsmallest(10, matches):
+            items.append(_agent_item(agent))
 
-                items.append(
-                    DropdownItem(
-                        main=Content.from_markup(display),
-                        prefix=prefix,
-                        id=completion_value,  # SmartAutoComplete uses this for insertion
-                    )
-                )
-
-        # Sort by match quality
-        def get_sort_key(item: DropdownItem) -> tuple:
-            return (search not in (item.id or "").lower(), item.id or "")
-
-        items.sort(key=get_sort_key)
-
-        return items[:10]
+        return items
 
     def _get_tool_completions(self, text: str) -> list[DropdownItem]:
         """Get tool completions for tool-* references."""
@@ -236,55 +307,31 @@ class CompletionProvider:
                 items.append(
                     DropdownItem(
                         main=tool,
-                        prefix=Content.from_markup(f"[bold yellow]{CATEGORY_ICONS['tool']}[/] "),
+                        prefix=_PREFIX_TOOL,
                     )
                 )
+                if len(items) >= 10:
+                    break
 
-        return items[:10]
+        return items
 
     def _get_discovery_items(self) -> list[DropdownItem]:
         """Get items shown when input is empty (discovery mode)."""
-        # Show most common commands
-        common = ["/help", "/bundle", "/reset", "/clear", "/quit"]
-        items = []
-
-        for cmd_name in common:
-            if cmd_name in COMMANDS:
-                items.append(self._make_command_item(COMMANDS[cmd_name]))
-
-        return items
-
-    def _make_command_item(self, cmd_info: CommandInfo) -> DropdownItem:
-        """Create a DropdownItem for a command.
-
-        IMPORTANT: main text is what gets inserted on Tab.
-        Display: icon + command + description (but only command is inserted)
-        """
-        icon = CATEGORY_ICONS.get(cmd_info.category, "⌘")
-
-        # Style based on category
-        if cmd_info.category == "subcommand":
-            prefix = Content.from_markup(f"[dim]{icon}[/] ")
-        else:
-            prefix = Content.from_markup(f"[bold green]{icon}[/] ")
-
-        # Main shows: "command  description" but value is extracted as just command
-        # We use a custom format where main has command padded, then dim description
-        padded_cmd = f"{cmd_info.name:<20}"
-        main_display = f"{padded_cmd} [dim]{cmd_info.description}[/dim]"
-
-        return DropdownItem(
-            main=Content.from_markup(main_display),
-            prefix=prefix,
-            id=cmd_info.name,  # Store actual command in id for potential use
-        )
+        return _DISCOVERY_ITEMS
 
     def _get_agents(self) -> list[str]:
-        """Get available agents from runtime."""
-        if self._cached_agents is not None:
+        """Get available agents from runtime (cached for _CACHE_TTL seconds)."""
+        now = time.monotonic()
+        if self._cached_agents is not None and now - self._cached_agents_at < _CACHE_TTL:
             return self._cached_agents
+        self._cached_agents_at = now
+
+        if self._bridge_has_agents is None:
+            self._bridge_has_agents = bool(self._bridge) and hasattr(
+                self._bridge, "get_available_agents"
+            )
 
-        if self._bridge and hasattr(self._bridge, "get_available_agents"):
+        if self._bridge_has_agents and self._bridge is not None:
             try:
                 self._cached_agents = self._bridge.get_available_agents() or []
             except Exception:
@@ -303,11 +350,18 @@ class CompletionProvider:
         return self._cached_agents
 
     def _get_tools(self) -> list[str]:
-        """Get available tools from runtime."""
-        if self._cached_tools is not None:
+        """Get available tools from runtime (cached for _CACHE_TTL seconds)."""
+        now = time.monotonic()
+        if self._cached_tools is not None and now - self._cached_tools_at < _CACHE_TTL:
             return self._cached_tools
+        self._cached_tools_at = now
+
+        if self._bridge_has_tools is None:
+            self._bridge_has_tools = bool(self._bridge) and hasattr(
+                self._bridge, "get_available_tools"
+            )
 
-        if self._bridge and hasattr(self._bridge, "get_available_tools"):
+        if self._bridge_has_tools and self._bridge is not None:
             try:
                 self._cached_tools = self._bridge.get_available_tools() or []
             except Exception:
@@ -7,6 +7,8 @@ to interested UI components without tight coupling.
 from __future__ import annotations
 
 import asyncio
+import inspect
+import itertools
 import logging
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
@@ -16,19 +18,32 @@ if TYPE_CHECKING:
     from amplifier_app_runtime.protocol.events import Event
     from amplifier_app_runtime.sdk import TransportAmplifierClient
 
-logger = logging.getLogger(__name__)
+_logger: logging.Logger | None = None
+
+
+def _log() -> logging.Logger:
+    """Get the module logger, created on first use (only error paths log)."""
+    global _logger
+    if _logger is None:
+        _logger = logging.getLogger(__name__)
+    return _logger
+
 
 # Type alias for event callbacks
 EventCallback = Callable[["Event"], Awaitable[None] | None]
 
+# Interned event-type filters, so subscriptions with the same filter share one frozenset
+_INTERNED_EVENT_TYPES: dict[frozenset[str], frozenset[str]] = {}
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class EventSubscription:
     """A subscription to events."""
 
     callback: EventCallback
-    event_types: set[str] | None = None  # None = all events
+    event_types: frozenset[str] | None = None  # None = all events
     session_id: str | None = None  # None = all sessions
+    is_async: bool = False  # Callback is a coroutine function (resolved at subscribe)
 
 
 class EventBridge:
@@ -60,15 +75,23 @@ class EventBridge:
     """
 
     def __init__(self) -> None:
-        self._subscriptions: list[EventSubscription] = []
+        # All subscriptions by id(sub), plus reverse lookup for unsubscribe(callback)
+        self._subscriptions: dict[int, EventSubscription] = {}
+        self._callback_to_subs: dict[EventCallback, set[int]] = {}
+        # Copy-on-write dispatch indexes - _dispatch iterates a snapshot.
+        # Each subscription lives in exactly one of these:
+        # by event type if it filters on types, else by session, else catch-all
+        self._by_type: dict[str, tuple[EventSubscription, ...]] = {}
+        self._by_session: dict[str, tuple[EventSubscription, ...]] = {}
+        self._catch_all: tuple[EventSubscription, ...] = ()
         self._client: TransportAmplifierClient | None = None
         self._listen_task: asyncio.Task[None] | None = None
-        self._lock = asyncio.Lock()
+        self._on_disconnect: Callable[[], None] | None = None
 
     def subscribe(
         self,
         callback: EventCallback,
-        event_types: set[str] | None = None,
+        event_types: set[str] | frozenset[str] | None = None,
         session_id: str | None = None,
     ) -> EventSubscription:
         """Subscribe to events.
@@ -81,12 +104,19 @@ class EventBridge:
         Returns:
             Subscription object (can be used to unsubscribe)
         """
+        frozen_types = None
+        if event_types is not None:
+            frozen_types = frozenset(event_types)
+            frozen_types = _INTERNED_EVENT_TYPES.setdefault(frozen_types, frozen_types)
         sub = EventSubscription(
             callback=callback,
-            event_types=event_types,
+            event_types=frozen_types,
             session_id=session_id,
+            is_async=inspect.iscoroutinefunction(callback),
         )
-        self._subscriptions.append(sub)
+        self._subscriptions[id(sub)] = sub
+        self._callback_to_subs.setdefault(callback, set()).add(id(sub))
+        self._index(sub)
         return sub
 
     def unsubscribe(self, callback_or_sub: EventCallback | EventSubscription) -> bool:
@@ -96,28 +126,67 @@ class EventBridge:
             callback_or_sub: The callback or subscription to remove
 
         Returns:
-            True if subscription was found and removed
+            True if any subscription was found and removed
         """
         if isinstance(callback_or_sub, EventSubscription):
-            try:
-                self._subscriptions.remove(callback_or_sub)
-                return True
-            except ValueError:
+            sub = self._subscriptions.get(id(callback_or_sub))
+            if sub is not callback_or_sub:
                 return False
-        else:
-            # Find by callback
-            for sub in self._subscriptions:
-                if sub.callback == callback_or_sub:
-                    self._subscriptions.remove(sub)
-                    return True
+            self._remove(sub)
+            return True
+
+        # Find by callback - removes every subscription made with it
+        sub_ids = self._callback_to_subs.get(callback_or_sub)
+        if not sub_ids:
             return False
+        for sub_id in tuple(sub_ids):
+            self._remove(self._subscriptions[sub_id])
+        return True
+
+    def _remove(self, sub: EventSubscription) -> None:
+        """Drop a subscription from all lookup tables."""
+        del self._subscriptions[id(sub)]
+        sub_ids = self._callback_to_subs[sub.callback]
+        sub_ids.discard(id(sub))
+        if not sub_ids:
+            del self._callback_to_subs[sub.callback]
+        self._unindex(sub)
+
+    def _index(self, sub: EventSubscription) -> None:
+        """Add a subscription to the dispatch indexes."""
+        if sub.event_types is not None:
+            for event_type in sub.event_types:
+                self._by_type[event_type] = self._by_type.get(event_type, ()) + (sub,)
+        elif sub.session_id is not None:
+            self._by_session[sub.session_id] = self._by_session.get(sub.session_id, ()) + (sub,)
+        else:
+            self._catch_all = self._catch_all + (sub,)
+
+    def _unindex(self, sub: EventSubscription) -> None:
+        """Remove a subscription from the dispatch indexes."""
+        if sub.event_types is not None:
+            for event_type in sub.event_types:
+                _remove_from_index(self._by_type, event_type, sub)
+        elif sub.session_id is not None:
+            _remove_from_index(self._by_session, sub.session_id, sub)
+        else:
+            self._catch_all = tuple(s for s in self._catch_all if s is not sub)
 
-    def start(self, client: TransportAmplifierClient) -> None:
+    def start(
+        self,
+        client: TransportAmplifierClient,
+        on_disconnect: Callable[[], None] | None = None,
+    ) -> None:
         """Start listening to events from the client.
 
         Called by RuntimeManager when connection is established.
+
+        Args:
+            client: Connected SDK client to listen on
+            on_disconnect: Called when the event stream ends or fails
         """
         self._client = client
+        self._on_disconnect = on_disconnect
         if self._listen_task is None or self._listen_task.done():
             self._listen_task = asyncio.create_task(self._listen_loop())
 
@@ -140,35 +209,64 @@ class EventBridge:
             async for event in self._client.event.subscribe():
                 await self._dispatch(event)
         except asyncio.CancelledError:
-            pass
+            return
         except Exception as e:
-            logger.error(f"Event listener error: {e}")
+            _log().error(f"Event listener error: {e}")
 
-    async def _dispatch(self, event: Event) -> None:
-        """Dispatch event to matching subscribers."""
-        for sub in self._subscriptions:
-            if self._matches(sub, event):
-                try:
-                    result = sub.callback(event)
-                    if asyncio.iscoroutine(result):
-                        await result
-                except Exception as e:
-                    logger.error(f"Event callback error: {e}")
-
-    def _matches(self, sub: EventSubscription, event: Event) -> bool:
-        """Check if event matches subscription filters."""
-        # Check event type filter
-        if sub.event_types is not None and event.type not in sub.event_types:
-            return False
+        # The event stream ended, so the connection is gone
+        if self._on_disconnect:
+            self._on_disconnect()
 
-        # Check session filter
-        if sub.session_id is not None:
-            # Extract session_id from event data if present
-            event_session = event.data.get("session_id") if event.data else None
-            if event_session != sub.session_id:
-                return False
+    async def _dispatch(self, event: Event) -> None:
+        """Dispatch event to matching subscribers.
 
-        return True
+        Only the catch-all, event-type and session buckets for this event
+        are visited, so cost scales with matching subscriptions rather than
+        with all of them.
+        """
+        event_session = event.data.get("session_id") if event.data else None
+        # Snapshot: (un)subscribing from a callback doesn't affect this dispatch
+        subs = itertools.chain(
+            self._catch_all,
+            self._by_type.get(event.type, ()),
+            self._by_session.get(event_session, ()) if event_session is not None else (),
+        )
+        coros = []
+        for sub in subs:
+            # Buckets already match on type; type-indexed subscriptions may
+            # still carry a session filter
+            if sub.session_id is not None and sub.session_id != event_session:
+                continue
+            # Sync callbacks run inline; async ones are awaited together below
+            try:
+                if sub.is_async:
+                    coros.append(sub.callback(event))
+                else:
+                    result = sub.callback(event)
+                    # Not declared async but returned an awaitable (lambda, partial, ...)
+                    if inspect.isawaitable(result):
+                        coros.append(result)
+            except Exception as e:
+                _log().error(f"Event callback error: {e}")
+
+        if coros:
+            # A slow async subscriber no longer delays the others
+            results = await asyncio.gather(*coros, return_exceptions=True)
+            for result in results:
+                # BaseException too: a subscriber raising CancelledError is still a failure
+                if isinstance(result, BaseException):
+                    _log().error(f"Event callback error: {result!r}")
+
+
+def _remove_from_index(
+    index: dict[str, tuple[EventSubscription, ...]], key: str, sub: EventSubscription
+) -> None:
+    """Remove a subscription from one bucket of a dispatch index."""
+    remaining = tuple(s for s in index.get(key, ()) if s is not sub)
+    if remaining:
+        index[key] = remaining
+    else:
+        index.pop(key, None)
 
 
 # Convenience decorators for common event patterns
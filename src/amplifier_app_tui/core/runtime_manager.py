@@ -9,9 +9,13 @@ Provides a transport-agnostic interface for:
 from __future__ import annotations
 
 import asyncio
+import functools
+import inspect
 import logging
+import random
+from collections.abc import Callable
 from dataclasses import dataclass, field
-from enum import Enum
+from enum import StrEnum
 from typing import TYPE_CHECKING, Any
 
 from amplifier_app_runtime.sdk import (
@@ -25,12 +29,38 @@ from amplifier_app_runtime.sdk import (
 )
 
 if TYPE_CHECKING:
+    import httpx
+
     from .event_bridge import EventBridge
 
 logger = logging.getLogger(__name__)
 
+# Errors that retrying won't fix (missing runtime binary, no permission, unsupported)
+_UNRECOVERABLE_ERRORS = (FileNotFoundError, PermissionError, NotImplementedError)
+
+
+@functools.cache
+def _accepts_http_client(factory: Callable[..., Any]) -> bool:
+    """Check (once per factory) whether the SDK's attach factory takes an http_client."""
+    if "http_client" in inspect.signature(factory).parameters:
+        return True
+    logger.debug(
+        "create_attach_client() takes no http_client; attach mode will use the "
+        "SDK's own HTTP client (no shared keep-alive/HTTP/2 connection)"
+    )
+    return False
+
+
+def _h2_available() -> bool:
+    """Check whether httpx's optional HTTP/2 support (h2) is installed."""
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
 
-class ConnectionMode(str, Enum):
+class ConnectionMode(StrEnum):
     """How to connect to the runtime."""
 
     SUBPROCESS = "subprocess"  # Launch runtime as child process
@@ -38,7 +68,7 @@ class ConnectionMode(str, Enum):
     MOCK = "mock"  # Mock transport for testing
 
 
-@dataclass
+@dataclass(slots=True)
 class RuntimeConfig:
     """Configuration for RuntimeManager.
 
@@ -48,8 +78,17 @@ class RuntimeConfig:
         working_directory: CWD for subprocess
         env: Additional environment variables
         server_url: URL for attach mode
+        http2: Multiplex attach-mode requests over HTTP/2 (needs the h2 package)
+        keepalive_ping_interval: Seconds between attach-mode keep-alive pings (0 = off)
         timeout: Connection/request timeout
         auto_reconnect: Whether to auto-reconnect on disconnect
+        reconnect_delay: Initial reconnect backoff delay in seconds
+        max_reconnect_delay: Upper bound for the reconnect backoff delay
+        reconnect_jitter: Fraction of each backoff delay that is randomized
+            (1.0 = full jitter, 0.5 = equal jitter, 0.0 = no jitter)
+        max_reconnect_attempts: Give up after this many failed attempts (None = never)
+        health_check_interval: Safety-net connection check period; disconnects
+            are normally detected from transport state changes
     """
 
     mode: ConnectionMode = ConnectionMode.SUBPROCESS
@@ -61,11 +100,17 @@ class RuntimeConfig:
 
     # Attach mode settings
     server_url: str = "http://localhost:4096"
+    http2: bool = True
+    keepalive_ping_interval: float = 10.0
 
     # Common settings
     timeout: float = 30.0
     auto_reconnect: bool = True
     reconnect_delay: float = 1.0
+    max_reconnect_delay: float = 30.0
+    reconnect_jitter: float = 1.0
+    max_reconnect_attempts: int | None = 10
+    health_check_interval: float = 30.0
 
 
 class RuntimeManager:
@@ -104,7 +149,14 @@ class RuntimeManager:
         self._client: TransportAmplifierClient | None = None
         self._event_bridge = event_bridge
         self._reconnect_task: asyncio.Task[None] | None = None
+        self._keepalive_task: asyncio.Task[None] | None = None
         self._stop_event = asyncio.Event()
+        self._reconnect_failed = asyncio.Event()
+        self._disconnect_event = asyncio.Event()
+        # Attach mode: one keep-alive HTTP client reused across reconnects
+        self._http_client: httpx.AsyncClient | None = None
+        # Replaceable for deterministic backoff in tests
+        self._rng = random.Random()
 
     @property
     def client(self) -> TransportAmplifierClient:
@@ -127,6 +179,15 @@ class RuntimeManager:
         """Check if connected to runtime."""
         return self._client is not None and self._client.is_connected
 
+    @property
+    def reconnect_failed(self) -> asyncio.Event:
+        """Event set once reconnection has been abandoned.
+
+        Set when the attempt limit is exhausted or an unrecoverable error
+        occurs; the TUI can await it to show a terminal disconnected state.
+        """
+        return self._reconnect_failed
+
     @property
     def state(self) -> TransportState:
         """Get current transport state."""
@@ -145,19 +206,30 @@ class RuntimeManager:
             return
 
         self._stop_event.clear()
+        self._reconnect_failed.clear()
         self._client = self._create_client()
 
+        self._watch_transport(self._client)
+
         try:
             await self._client.connect()
             logger.info(f"Connected to runtime via {self.config.mode.value}")
 
             # Start event bridge if configured
             if self._event_bridge:
-                self._event_bridge.start(self._client)
+                self._event_bridge.start(self._client, on_disconnect=self.notify_disconnected)
 
             # Start reconnection monitor if auto_reconnect enabled
             if self.config.auto_reconnect:
                 self._reconnect_task = asyncio.create_task(self._reconnect_loop())
+                self._reconnect_task.add_done_callback(self._on_reconnect_task_done)
+
+            # Keep the pooled attach connection from idling out
+            if (
+                self.config.mode == ConnectionMode.ATTACH
+                and self.config.keepalive_ping_interval > 0
+            ):
+                self._keepalive_task = asyncio.create_task(self._ping_loop())
 
         except Exception as e:
             self._client = None
@@ -178,8 +250,19 @@ class RuntimeManager:
                 await self._reconnect_task
             except asyncio.CancelledError:
                 pass
+            except Exception:
+                pass  # Already logged by _on_reconnect_task_done
             self._reconnect_task = None
 
+        # Cancel keep-alive pings
+        if self._keepalive_task:
+            self._keepalive_task.cancel()
+            try:
+                await self._keepalive_task
+            except asyncio.CancelledError:
+                pass
+            self._keepalive_task = None
+
         # Stop event bridge
         if self._event_bridge:
             self._event_bridge.stop()
@@ -189,6 +272,11 @@ class RuntimeManager:
             await self._client.disconnect()
             self._client = None
 
+        # Close the shared HTTP client last - reconnects keep it alive
+        if self._http_client:
+            await self._http_client.aclose()
+            self._http_client = None
+
         logger.info("RuntimeManager stopped")
 
     async def restart(self) -> None:
@@ -206,30 +294,123 @@ class RuntimeManager:
                     env=self.config.env,
                 )
             case ConnectionMode.ATTACH:
+                kwargs: dict[str, Any] = {}
+                if _accepts_http_client(create_attach_client):
+                    kwargs["http_client"] = self._get_http_client()
                 return create_attach_client(
                     base_url=self.config.server_url,
                     timeout=self.config.timeout,
+                    **kwargs,
                 )
             case ConnectionMode.MOCK:
                 return TransportAmplifierClient(
                     _transport=create_mock_transport(),
                 )
 
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Get the shared keep-alive HTTP client for attach mode."""
+        if self._http_client is None:
+            import httpx
+
+            if self.config.http2 and _h2_available():
+                # One multiplexed connection carries every request; keep it warm
+                self._http_client = httpx.AsyncClient(
+                    http2=True,
+                    timeout=self.config.timeout,
+                    limits=httpx.Limits(max_keepalive_connections=1, keepalive_expiry=600.0),
+                )
+            else:
+                self._http_client = httpx.AsyncClient(
+                    timeout=self.config.timeout,
+                    limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+                )
+        return self._http_client
+
+    def _on_reconnect_task_done(self, task: asyncio.Task[None]) -> None:
+        """Surface a crashed reconnect monitor as soon as it dies."""
+        if task.cancelled():
+            return
+        exc = task.exception()
+        if exc is not None:
+            logger.error(f"Reconnect monitor crashed: {exc!r}")
+            self._reconnect_failed.set()
+
+    def _watch_transport(self, client: TransportAmplifierClient) -> None:
+        """Wake the reconnect monitor whenever the client's transport changes state.
+
+        Wraps the transport's _set_state so state transitions set the disconnect
+        event; call_soon_threadsafe keeps this safe if the transport changes state
+        off the event loop thread.
+        """
+        transport: Any = getattr(client, "transport", None)
+        set_state = getattr(transport, "_set_state", None)
+        if set_state is None:
+            logger.debug("Transport has no _set_state(); relying on health-check polling")
+            return
+
+        loop = asyncio.get_running_loop()
+        disconnect_event = self._disconnect_event
+
+        @functools.wraps(set_state)
+        def _set_state(*args: Any, **kwargs: Any) -> Any:
+            result = set_state(*args, **kwargs)
+            loop.call_soon_threadsafe(disconnect_event.set)
+            return result
+
+        transport._set_state = _set_state
+
+    def notify_disconnected(self) -> None:
+        """Signal that the connection dropped, waking the reconnect monitor."""
+        self._disconnect_event.set()
+
     async def _reconnect_loop(self) -> None:
-        """Monitor connection and reconnect if needed."""
-        while not self._stop_event.is_set():
-            await asyncio.sleep(1.0)
+        """Monitor connection and reconnect if needed.
+
+        Wakes on every transport state change (see _watch_transport) and when
+        notify_disconnected() is called (the event bridge does this when its
+        stream ends). health_check_interval is only a safety net.
+        """
+        while not self._stop_event.is_set() and not self._reconnect_failed.is_set():
+            try:
+                await asyncio.wait_for(
+                    self._disconnect_event.wait(), self.config.health_check_interval
+                )
+            except TimeoutError:
+                pass
+            self._disconnect_event.clear()
 
             if self._client and not self._client.is_connected:
                 logger.warning("Connection lost, attempting reconnect...")
                 await self._attempt_reconnect()
 
+    async def _ping_loop(self) -> None:
+        """Send periodic keep-alive pings so an idle attach connection stays open."""
+        interval = self.config.keepalive_ping_interval
+        while not self._stop_event.is_set():
+            await asyncio.sleep(interval)
+
+            client = self._client
+            if client is None or not client.is_connected:
+                continue
+            ping = getattr(client, "ping", None)
+            if ping is None:
+                logger.info("SDK client has no ping(); attach keep-alive pings disabled")
+                return
+            try:
+                await ping()
+            except Exception as e:
+                logger.debug(f"Keep-alive ping failed: {e}")
+
     async def _attempt_reconnect(self) -> None:
-        """Attempt to reconnect with backoff."""
+        """Attempt to reconnect with jittered exponential backoff."""
         delay = self.config.reconnect_delay
-        max_delay = 30.0
+        max_delay = self.config.max_reconnect_delay
+        jitter = self.config.reconnect_jitter
+        max_attempts = self.config.max_reconnect_attempts
+        attempt = 0
 
         while not self._stop_event.is_set():
+            attempt += 1
             try:
                 # Disconnect cleanly first
                 if self._client:
@@ -237,18 +418,31 @@ class RuntimeManager:
 
                 # Create new client and connect
                 self._client = self._create_client()
+                self._watch_transport(self._client)
                 await self._client.connect()
 
                 # Restart event bridge
                 if self._event_bridge:
-                    self._event_bridge.start(self._client)
+                    self._event_bridge.start(self._client, on_disconnect=self.notify_disconnected)
 
                 logger.info("Reconnected successfully")
                 return
 
+            except _UNRECOVERABLE_ERRORS as e:
+                logger.error(f"Reconnect failed with unrecoverable error: {e}")
+                self._reconnect_failed.set()
+                return
+
             except Exception as e:
-                logger.warning(f"Reconnect failed: {e}, retrying in {delay}s")
-                await asyncio.sleep(delay)
+                if max_attempts is not None and attempt >= max_attempts:
+                    logger.error(f"Reconnect failed after {attempt} attempts: {e}")
+                    self._reconnect_failed.set()
+                    return
+
+                # Jittered sleep so clients that dropped together don't retry in lockstep
+                sleep_for = delay * (1.0 - jitter) + self._rng.uniform(0.0, delay * jitter)
+                logger.warning(f"Reconnect failed: {e}, retrying in {sleep_for:.1f}s")
+                await asyncio.sleep(sleep_for)
                 delay = min(delay * 2, max_delay)
 
     # Mock transport helpers for testing
@@ -11,13 +11,15 @@ Based on amplifier-web's sub-session handling patterns.
 
 from __future__ import annotations
 
+import sys
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from typing import Any
 
-from .base import EventProcessor, ProcessorAction, ProcessorResult
+from .base import UNHANDLED_RESULT, EventProcessor, ProcessorAction, ProcessorResult
 
 
-@dataclass
+@dataclass(slots=True)
 class SubSession:
     """A sub-session (nested agent) state."""
 
@@ -28,14 +30,16 @@ class SubSession:
     nesting_depth: int = 1
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentState:
     """State for agent/sub-session processing."""
 
-    # Map parent_tool_call_id -> SubSession
+    # Map child session_id -> SubSession (carries its parent_tool_call_id)
     sub_sessions: dict[str, SubSession] = field(default_factory=dict)
-    # Map child_session_id -> parent_tool_call_id (for routing events)
-    child_to_parent: dict[str, str] = field(default_factory=dict)
+    # Map parent_tool_call_id -> child session_id (only for get_sub_session)
+    parent_to_child: dict[str, str] = field(default_factory=dict)
+    # Number of sub-sessions with status "running" (kept in sync by _set_status)
+    running_count: int = 0
     # Current main session info
     main_session_id: str | None = None
     main_session_status: str = "disconnected"
@@ -50,35 +54,41 @@ class AgentProcessor(EventProcessor):
 
     # Event types this processor handles
     HANDLED_EVENTS = frozenset(
-        [
-            "session_fork",
-            "session_start",
-            "session_end",
-            "session:start",
-            "session:end",
-            "session_created",
-        ]
+        map(
+            sys.intern,
+            [
+                "session_fork",
+                "session_start",
+                "session_end",
+                "session:start",
+                "session:end",
+                "session_created",
+            ],
+        )
     )
 
     def __init__(self, app: Any = None) -> None:
         super().__init__(app)
         self._state = AgentState()
+        # One entry per event type in HANDLED_EVENTS
+        self._handlers: dict[str, Callable[[dict[str, Any]], ProcessorResult]] = {
+            "session_fork": self._handle_session_fork,
+            "session_start": self._handle_session_start,
+            "session:start": self._handle_session_start,
+            "session_created": self._handle_session_start,
+            "session_end": self._handle_session_end,
+            "session:end": self._handle_session_end,
+        }
 
     def handles(self, event_type: str) -> bool:
         return event_type in self.HANDLED_EVENTS
 
     def process(self, event_type: str, data: dict[str, Any]) -> ProcessorResult:
         """Process an agent/session event."""
-        normalized = event_type.replace(":", "_")
-
-        if normalized == "session_fork":
-            return self._handle_session_fork(data)
-        elif normalized in ("session_start", "session_created"):
-            return self._handle_session_start(data)
-        elif normalized == "session_end":
-            return self._handle_session_end(data)
-
-        return ProcessorResult(handled=False)
+        handler = self._handlers.get(event_type)
+        if handler is None:
+            return UNHANDLED_RESULT
+        return handler(data)
 
     def _handle_session_fork(self, data: dict[str, Any]) -> ProcessorResult:
         """Handle sub-session fork (agent delegation).
@@ -90,7 +100,7 @@ class AgentProcessor(EventProcessor):
         agent_name = data.get("agent")
 
         if not child_id:
-            return ProcessorResult(handled=False)
+            return UNHANDLED_RESULT
 
         # If no parent_tool_call_id provided, we need to find it
         # This happens when the event doesn't include it directly
@@ -106,12 +116,22 @@ class AgentProcessor(EventProcessor):
             agent_name=agent_name,
             status="running",
         )
-        self._state.sub_sessions[parent_tool_call_id] = sub_session
-        self._state.child_to_parent[child_id] = parent_tool_call_id
+        # A re-used parent key replaces its previous sub-session
+        previous_child = self._state.parent_to_child.get(parent_tool_call_id)
+        if previous_child is not None and previous_child != child_id:
+            previous = self._state.sub_sessions.pop(previous_child, None)
+            if previous and previous.status == "running":
+                self._state.running_count -= 1
+        replaced = self._state.sub_sessions.get(child_id)
+        if replaced and replaced.status == "running":
+            self._state.running_count -= 1
+        self._state.sub_sessions[child_id] = sub_session
+        self._state.running_count += 1
+        self._state.parent_to_child[parent_tool_call_id] = child_id
 
         # Update UI if app available
-        if self._app:
-            self._app.start_sub_session(
+        if app := self._app:
+            app.start_sub_session(
                 parent_tool_call_id=parent_tool_call_id,
                 session_id=child_id,
                 agent_name=agent_name or "agent",
@@ -134,9 +154,9 @@ class AgentProcessor(EventProcessor):
 
         if parent_id:
             # This is a sub-session start
-            parent_tool_call_id = self._state.child_to_parent.get(session_id or "")
-            if parent_tool_call_id and parent_tool_call_id in self._state.sub_sessions:
-                self._state.sub_sessions[parent_tool_call_id].status = "running"
+            sub_session = self._state.sub_sessions.get(session_id or "")
+            if sub_session:
+                self._set_status(sub_session, "running")
         else:
             # Main session start
             self._state.main_session_id = session_id
@@ -154,15 +174,15 @@ class AgentProcessor(EventProcessor):
         status = data.get("status", "complete")
 
         # Check if this is a sub-session
-        parent_tool_call_id = self._state.child_to_parent.get(session_id or "")
-        if parent_tool_call_id:
+        sub_session = self._state.sub_sessions.get(session_id or "")
+        if sub_session:
             # Sub-session ended
-            if parent_tool_call_id in self._state.sub_sessions:
-                self._state.sub_sessions[parent_tool_call_id].status = status
+            self._set_status(sub_session, status)
+            parent_tool_call_id = sub_session.parent_tool_call_id
 
             # Update UI if app available
-            if self._app:
-                self._app.end_sub_session(
+            if app := self._app:
+                app.end_sub_session(
                     parent_tool_call_id=parent_tool_call_id,
                     status=status,
                 )
@@ -185,16 +205,26 @@ class AgentProcessor(EventProcessor):
                 data={"session_id": session_id, "status": status},
             )
 
+    def _set_status(self, sub_session: SubSession, status: str) -> None:
+        """Update a sub-session's status, keeping running_count in sync."""
+        was_running = sub_session.status == "running"
+        is_running = status == "running"
+        if was_running != is_running:
+            self._state.running_count += 1 if is_running else -1
+        sub_session.status = status
+
     def get_parent_tool_call_id(self, child_session_id: str) -> str | None:
         """Get the parent tool call ID for a child session.
 
         Used for routing events from sub-sessions to the correct context.
         """
-        return self._state.child_to_parent.get(child_session_id)
+        sub_session = self._state.sub_sessions.get(child_session_id)
+        return sub_session.parent_tool_call_id if sub_session else None
 
     def get_sub_session(self, parent_tool_call_id: str) -> SubSession | None:
         """Get a sub-session by its parent tool call ID."""
-        return self._state.sub_sessions.get(parent_tool_call_id)
+        child_id = self._state.parent_to_child.get(parent_tool_call_id)
+        return self._state.sub_sessions.get(child_id) if child_id else None
 
     def is_sub_session_event(self, data: dict[str, Any]) -> bool:
         """Check if an event belongs to a sub-session.
@@ -204,38 +234,45 @@ class AgentProcessor(EventProcessor):
         - child_session_id set (can be mapped to parent)
         - nesting_depth > 0
         """
-        if data.get("parent_tool_call_id"):
+        # Cheapest discriminators first; each is a single dict lookup
+        if (data.get("nesting_depth") or 0) > 0:
             return True
-        if data.get("child_session_id"):
-            return data["child_session_id"] in self._state.child_to_parent
-        if data.get("nesting_depth", 0) > 0:
+        if data.get("parent_tool_call_id"):
             return True
-        return False
+        child_session_id = data.get("child_session_id")
+        return bool(child_session_id) and child_session_id in self._state.sub_sessions
 
     def reset(self) -> None:
         """Reset agent state for new session."""
         self._state = AgentState()
         return None
 
-    def get_state(self) -> dict[str, Any]:
-        """Get current state for debugging."""
-        return {
-            "sub_sessions": {
-                k: {
+    def get_state(self, verbose: bool = False) -> dict[str, Any]:
+        """Get current state for debugging.
+
+        Args:
+            verbose: Also include the per-sub-session breakdown
+
+        Returns:
+            Dictionary of summary counters (plus details when verbose)
+        """
+        state: dict[str, Any] = {
+            "active_count": self._state.running_count,
+            "main_session_id": self._state.main_session_id,
+            "main_session_status": self._state.main_session_status,
+        }
+        if verbose:
+            state["sub_sessions"] = {
+                v.parent_tool_call_id: {
                     "session_id": v.session_id,
                     "agent": v.agent_name,
                     "status": v.status,
                 }
-                for k, v in self._state.sub_sessions.items()
-            },
-            "active_count": sum(
-                1 for s in self._state.sub_sessions.values() if s.status == "running"
-            ),
-            "main_session_id": self._state.main_session_id,
-            "main_session_status": self._state.main_session_status,
-        }
+                for v in self._state.sub_sessions.values()
+            }
+        return state
 
     @property
     def has_active_sub_sessions(self) -> bool:
         """Check if there are any active sub-sessions."""
-        return any(s.status == "running" for s in self._state.sub_sessions.values())
+        return self._state.running_count > 0
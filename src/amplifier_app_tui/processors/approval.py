@@ -9,13 +9,14 @@ Maintains state for pending approvals.
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
 from typing import Any
 
 from .base import EventProcessor, ProcessorAction, ProcessorResult
 
 
-@dataclass
+@dataclass(slots=True)
 class ApprovalRequest:
     """An approval request."""
 
@@ -28,7 +29,7 @@ class ApprovalRequest:
     remaining_time: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class ApprovalState:
     """State for approval processing."""
 
@@ -43,11 +44,14 @@ class ApprovalProcessor(EventProcessor):
 
     # Event types this processor handles
     HANDLED_EVENTS = frozenset(
-        [
-            "approval_request",
-            "approval:required",
-            "approval_required",
-        ]
+        map(
+            sys.intern,
+            [
+                "approval_request",
+                "approval:required",
+                "approval_required",
+            ],
+        )
     )
 
     def __init__(self, app: Any = None) -> None:
@@ -63,12 +67,13 @@ class ApprovalProcessor(EventProcessor):
 
     def _handle_approval_request(self, data: dict[str, Any]) -> ProcessorResult:
         """Handle approval request."""
-        approval_id = data.get("id", data.get("approval_id", ""))
+        # Fallback keys are only looked up when the primary key is absent
+        approval_id = data["id"] if "id" in data else data.get("approval_id", "")
         prompt = data.get("prompt", "")
         options = data.get("options", ["approve", "deny"])
         timeout = data.get("timeout", 60)
         default = data.get("default", "deny")
-        tool_name = data.get("tool_name", data.get("tool"))
+        tool_name = data["tool_name"] if "tool_name" in data else data.get("tool")
 
         # Create approval request record
         request = ApprovalRequest(
@@ -83,10 +88,10 @@ class ApprovalProcessor(EventProcessor):
         self._state.pending[approval_id] = request
 
         # Update UI if app available
-        if self._app:
+        if app := self._app:
             # Extract params for display
-            params = data.get("params", data.get("arguments", {}))
-            self._app.add_inline_approval(
+            params = data["params"] if "params" in data else data.get("arguments", {})
+            app.add_inline_approval(
                 tool_name=tool_name or "unknown",
                 params=params if isinstance(params, dict) else {},
                 approval_id=approval_id,
@@ -117,19 +122,26 @@ class ApprovalProcessor(EventProcessor):
         self._state = ApprovalState()
         return None
 
-    def get_state(self) -> dict[str, Any]:
-        """Get current state for debugging."""
-        return {
-            "pending": {
+    def get_state(self, verbose: bool = False) -> dict[str, Any]:
+        """Get current state for debugging.
+
+        Args:
+            verbose: Also include the per-approval breakdown
+
+        Returns:
+            Dictionary of summary counters (plus details when verbose)
+        """
+        state: dict[str, Any] = {"pending_count": len(self._state.pending)}
+        if verbose:
+            state["pending"] = {
                 k: {
                     "tool_name": v.tool_name,
                     "timeout": v.timeout,
                     "remaining": v.remaining_time,
                 }
                 for k, v in self._state.pending.items()
-            },
-            "pending_count": len(self._state.pending),
-        }
+            }
+        return state
 
     @property
     def has_pending(self) -> bool:
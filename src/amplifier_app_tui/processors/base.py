@@ -6,16 +6,17 @@ used across the processor system.
 
 from __future__ import annotations
 
+import weakref
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from enum import Enum
+from enum import StrEnum
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from ..app import AmplifierTUI
 
 
-class ProcessorAction(Enum):
+class ProcessorAction(StrEnum):
     """Actions a processor can request."""
 
     NONE = "none"  # No action needed
@@ -25,7 +26,7 @@ class ProcessorAction(Enum):
     ADD_ERROR = "add_error"  # Add an error message
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessorResult:
     """Result from processing an event.
 
@@ -41,6 +42,10 @@ class ProcessorResult:
     new_state: str | None = None  # For SET_STATE action
 
 
+# Shared result for unhandled events (avoids an allocation per miss) - treat as read-only
+UNHANDLED_RESULT = ProcessorResult(handled=False)
+
+
 class EventProcessor(ABC):
     """Base class for event processors.
 
@@ -55,7 +60,15 @@ class EventProcessor(ABC):
         Args:
             app: The TUI application instance. Can be None for testing.
         """
-        self._app = app
+        # Weak back-reference so processors never keep the app alive
+        self._app_ref: weakref.ref[AmplifierTUI] | None = (
+            weakref.ref(app) if app is not None else None
+        )
+
+    @property
+    def _app(self) -> AmplifierTUI | None:
+        """The app instance, or None if unset or already collected."""
+        return self._app_ref() if self._app_ref is not None else None
 
     @property
     def app(self) -> AmplifierTUI | None:
@@ -64,7 +77,7 @@ class EventProcessor(ABC):
 
     def set_app(self, app: AmplifierTUI) -> None:
         """Set the app instance (for deferred initialization)."""
-        self._app = app
+        self._app_ref = weakref.ref(app)
 
     @abstractmethod
     def handles(self, event_type: str) -> bool:
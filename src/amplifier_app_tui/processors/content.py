@@ -9,31 +9,78 @@ Based on amplifier-web's content handling patterns.
 
 from __future__ import annotations
 
+import asyncio
+import sys
+import time
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from typing import Any
 
-from .base import EventProcessor, ProcessorAction, ProcessorResult
+from .base import UNHANDLED_RESULT, EventProcessor, ProcessorAction, ProcessorResult
 
+# Text deltas are coalesced into one append_content call per this many chunks
+# or per frame (~60 fps), whichever comes first; a timer flushes the tail when
+# the stream pauses
+_FLUSH_CHUNKS = 8
+_FLUSH_INTERVAL = 0.016
 
-@dataclass
+# Server indices below this use the dense list map; anything else (None, negative,
+# huge or non-int) goes through the dict fallback
+_DENSE_INDEX_LIMIT = 256
+
+# Shared result for content deltas, which carry no per-event data - treat as read-only
+_DELTA_RESULT = ProcessorResult(handled=True, action=ProcessorAction.UPDATE_UI)
+
+
+@dataclass(slots=True)
 class ContentBlock:
     """A content block being streamed."""
 
     block_type: str  # text, thinking, tool_use
-    content: str = ""
     is_streaming: bool = True
     order: int = 0
+    # Deltas are buffered and joined lazily to keep streaming O(n)
+    _parts: list[str] = field(default_factory=list, repr=False)
+    _joined: str | None = field(default=None, repr=False)
+
+    @property
+    def content(self) -> str:
+        """Full block text, joined on first read after new deltas."""
+        if self._joined is None:
+            self._joined = "".join(self._parts)
+        return self._joined
+
+    @content.setter
+    def content(self, value: str) -> None:
+        self._parts = [value]
+        self._joined = value
+
+    @property
+    def content_length(self) -> int:
+        """Length of the block text without forcing a join."""
+        if self._joined is not None:
+            return len(self._joined)
+        return sum(len(p) for p in self._parts)
+
+    def append(self, delta: str) -> None:
+        """Buffer a streamed delta."""
+        self._parts.append(delta)
+        self._joined = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ContentState:
     """State for content streaming."""
 
     blocks: list[ContentBlock] = field(default_factory=list)
-    block_index_map: dict[int, int] = field(default_factory=dict)  # server index -> local index
+    # Server index -> local index (-1 = unmapped); server indices are small and dense
+    block_index_list: list[int] = field(default_factory=list)
+    # Fallback for server indices outside the dense range
+    block_index_sparse: dict[Any, int] = field(default_factory=dict)
     next_local_index: int = 0
     order_counter: int = 0
     is_streaming: bool = False
+    current_thinking_idx: int | None = None  # streaming thinking block in blocks
 
 
 class ContentProcessor(EventProcessor):
@@ -45,73 +92,100 @@ class ContentProcessor(EventProcessor):
 
     # Event types this processor handles
     HANDLED_EVENTS = frozenset(
-        [
-            # Content block events (amplifier-core format)
-            "content_block:start",
-            "content_block:delta",
-            "content_block:end",
-            # Thinking events
-            "thinking:delta",
-            "thinking:final",
-            # Alternative formats (runtime may normalize)
-            "content_start",
-            "content_delta",
-            "content_end",
-            "thinking_delta",
-            "thinking_final",
-        ]
+        map(
+            sys.intern,
+            [
+                # Content block events (amplifier-core format)
+                "content_block:start",
+                "content_block:delta",
+                "content_block:end",
+                # Thinking events
+                "thinking:delta",
+                "thinking:final",
+                # Alternative formats (runtime may normalize)
+                "content_start",
+                "content_delta",
+                "content_end",
+                "thinking_delta",
+                "thinking_final",
+            ],
+        )
     )
 
     def __init__(self, app: Any = None) -> None:
         super().__init__(app)
         self._state = ContentState()
+        # get_state() result, rebuilt only after an event or reset changes state
+        self._state_snapshot: dict[str, Any] | None = None
+        # Bound app.append_content, held only while a text block streams
+        self._append_content: Callable[[str], None] | None = None
+        # Text deltas not yet sent to the app
+        self._pending_ui: list[str] = []
+        self._last_flush = 0.0
+        # Trailing flush for a paused stream (needs a running event loop)
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._handlers: dict[str, Callable[[dict[str, Any]], ProcessorResult]] = {
+            "content_block:start": self._handle_content_start,
+            "content_start": self._handle_content_start,
+            "content_block:delta": self._handle_content_delta,
+            "content_delta": self._handle_content_delta,
+            "content_block:end": self._handle_content_end,
+            "content_end": self._handle_content_end,
+            "thinking:delta": self._handle_thinking_delta,
+            "thinking_delta": self._handle_thinking_delta,
+            "thinking:final": self._handle_thinking_final,
+            "thinking_final": self._handle_thinking_final,
+        }
+
+    def set_app(self, app: Any) -> None:
+        """Set the app instance and drop the cached append callback."""
+        super().set_app(app)
+        self._append_content = None
 
     def handles(self, event_type: str) -> bool:
         return event_type in self.HANDLED_EVENTS
 
     def process(self, event_type: str, data: dict[str, Any]) -> ProcessorResult:
         """Process a content event."""
-        # Normalize event type (remove colons for matching)
-        normalized = event_type.replace(":", "_").replace("block_", "")
-
-        if normalized in ("content_start", "content_block_start"):
-            return self._handle_content_start(data)
-        elif normalized in ("content_delta", "content_block_delta"):
-            return self._handle_content_delta(data)
-        elif normalized in ("content_end", "content_block_end"):
-            return self._handle_content_end(data)
-        elif normalized in ("thinking_delta",):
-            return self._handle_thinking_delta(data)
-        elif normalized in ("thinking_final",):
-            return self._handle_thinking_final(data)
-
-        return ProcessorResult(handled=False)
+        handler = self._handlers.get(event_type)
+        if handler is None:
+            return UNHANDLED_RESULT
+        self._state_snapshot = None
+        return handler(data)
 
     def _handle_content_start(self, data: dict[str, Any]) -> ProcessorResult:
         """Handle content block start."""
+        self.flush_pending()
         block_type = data.get("block_type", "text")
         server_index = data.get("index", 0)
 
         # Map server index to local index
         local_index = self._state.next_local_index
-        self._state.block_index_map[server_index] = local_index
+        if type(server_index) is int and 0 <= server_index < _DENSE_INDEX_LIMIT:
+            index_list = self._state.block_index_list
+            if server_index >= len(index_list):
+                index_list.extend([-1] * (server_index + 1 - len(index_list)))
+            index_list[server_index] = local_index
+        else:
+            self._state.block_index_sparse[server_index] = local_index
         self._state.next_local_index += 1
 
         # Create new block
         block = ContentBlock(
             block_type=block_type,
-            content="",
             is_streaming=True,
             order=self._state.order_counter,
         )
         self._state.order_counter += 1
         self._state.blocks.append(block)
         self._state.is_streaming = True
+        if block_type == "thinking" and self._state.current_thinking_idx is None:
+            self._state.current_thinking_idx = len(self._state.blocks) - 1
 
         # Update UI if app available
-        if self._app:
+        if app := self._app:
             if block_type != "thinking":
-                self._app.start_response()
+                app.start_response()
 
         return ProcessorResult(
             handled=True,
@@ -128,42 +202,65 @@ class ContentProcessor(EventProcessor):
         server_index = data.get("index", 0)
         delta = data.get("delta", "")
 
-        local_index = self._state.block_index_map.get(server_index)
-        if local_index is None or local_index >= len(self._state.blocks):
-            return ProcessorResult(handled=False)
+        local_index = self._local_index(server_index)
+        if local_index < 0:
+            return UNHANDLED_RESULT
+
+        # Empty deltas (keep-alives) are acknowledged without touching block or UI
+        if not delta:
+            return _DELTA_RESULT
 
         # Append to block
         block = self._state.blocks[local_index]
-        block.content += delta
-
-        # Update UI if app available
-        if self._app and block.block_type != "thinking":
-            self._app.append_content(delta)
-
-        return ProcessorResult(
-            handled=True,
-            action=ProcessorAction.UPDATE_UI,
-            data={"delta": delta, "local_index": local_index},
-        )
+        block.append(delta)
+
+        # Buffer for the UI; flushed per chunk count or frame interval
+        if block.block_type != "thinking":
+            pending = self._pending_ui
+            pending.append(delta)
+            if (
+                len(pending) >= _FLUSH_CHUNKS
+                or time.monotonic() - self._last_flush >= _FLUSH_INTERVAL
+            ):
+                self.flush_pending()
+            elif self._flush_handle is None:
+                self._schedule_flush()
+
+        return _DELTA_RESULT
+
+    def _local_index(self, server_index: Any) -> int:
+        """Map a server block index to a local block index, or -1 if unknown."""
+        index_list = self._state.block_index_list
+        if type(server_index) is int and 0 <= server_index < len(index_list):
+            local_index = index_list[server_index]
+        else:
+            local_index = self._state.block_index_sparse.get(server_index, -1)
+        if local_index < len(self._state.blocks):
+            return local_index
+        return -1
 
     def _handle_content_end(self, data: dict[str, Any]) -> ProcessorResult:
         """Handle content block end."""
         server_index = data.get("index", 0)
         final_content = data.get("content")
 
-        local_index = self._state.block_index_map.get(server_index)
-        if local_index is None or local_index >= len(self._state.blocks):
-            return ProcessorResult(handled=False)
+        local_index = self._local_index(server_index)
+        if local_index < 0:
+            return UNHANDLED_RESULT
 
         block = self._state.blocks[local_index]
         if final_content is not None:
             block.content = final_content
         block.is_streaming = False
+        self.flush_pending()
+        self._append_content = None
+        if self._state.current_thinking_idx == local_index:
+            self._state.current_thinking_idx = None
 
         # Update UI if app available
-        if self._app:
+        if app := self._app:
             if block.block_type == "thinking":
-                self._app.end_thinking()
+                app.end_thinking()
             # Note: we don't call end_response here - that's done on prompt_complete
 
         return ProcessorResult(
@@ -174,30 +271,28 @@ class ContentProcessor(EventProcessor):
 
     def _handle_thinking_delta(self, data: dict[str, Any]) -> ProcessorResult:
         """Handle dedicated thinking delta event."""
+        self.flush_pending()
         delta = data.get("delta", "")
 
         # Find or create streaming thinking block
-        thinking_block = None
-        for block in self._state.blocks:
-            if block.block_type == "thinking" and block.is_streaming:
-                thinking_block = block
-                break
-
-        if not thinking_block:
+        thinking_idx = self._state.current_thinking_idx
+        if thinking_idx is not None:
+            thinking_block = self._state.blocks[thinking_idx]
+        else:
             # Create new thinking block
             thinking_block = ContentBlock(
                 block_type="thinking",
-                content="",
                 is_streaming=True,
                 order=self._state.order_counter,
             )
             self._state.order_counter += 1
             self._state.blocks.append(thinking_block)
+            self._state.current_thinking_idx = len(self._state.blocks) - 1
 
-        thinking_block.content += delta
-
-        if self._app:
-            self._app.add_thinking(delta)
+        if delta:
+            thinking_block.append(delta)
+            if app := self._app:
+                app.add_thinking(delta)
 
         return ProcessorResult(
             handled=True,
@@ -207,17 +302,19 @@ class ContentProcessor(EventProcessor):
 
     def _handle_thinking_final(self, data: dict[str, Any]) -> ProcessorResult:
         """Handle thinking finalized event."""
+        self.flush_pending()
         content = data.get("content", "")
 
-        # Find streaming thinking block
-        for block in self._state.blocks:
-            if block.block_type == "thinking" and block.is_streaming:
-                block.content = content
-                block.is_streaming = False
-                break
+        # Finalize streaming thinking block
+        thinking_idx = self._state.current_thinking_idx
+        if thinking_idx is not None:
+            block = self._state.blocks[thinking_idx]
+            block.content = content
+            block.is_streaming = False
+            self._state.current_thinking_idx = None
 
-        if self._app:
-            self._app.end_thinking()
+        if app := self._app:
+            app.end_thinking()
 
         return ProcessorResult(
             handled=True,
@@ -225,9 +322,42 @@ class ContentProcessor(EventProcessor):
             data={"content": content},
         )
 
+    def _schedule_flush(self) -> None:
+        """Flush buffered deltas after one interval if no later event does.
+
+        Without a running event loop the buffer is left for the caller to
+        flush (the router and bridge flush at turn and tool boundaries).
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._flush_handle = loop.call_later(_FLUSH_INTERVAL, self.flush_pending)
+
+    def flush_pending(self) -> None:
+        """Send buffered text deltas to the app in a single append_content call."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        pending = self._pending_ui
+        if not pending:
+            return
+        text = "".join(pending)
+        pending.clear()
+        self._last_flush = time.monotonic()
+
+        append = self._append_content
+        if append is None and (app := self._app):
+            append = self._append_content = app.append_content
+        if append is not None:
+            append(text)
+
     def reset(self) -> None:
         """Reset content state for new turn/session."""
+        self.flush_pending()
         self._state = ContentState()
+        self._state_snapshot = None
+        self._append_content = None
         return None
 
     def reset_block_mapping(self) -> None:
@@ -236,15 +366,21 @@ class ContentProcessor(EventProcessor):
         This is needed because the server resets block indices to 0
         after each tool result, but we want to accumulate blocks.
         """
-        self._state.block_index_map.clear()
+        self._state.block_index_list.clear()
+        self._state.block_index_sparse.clear()
 
     def get_state(self) -> dict[str, Any]:
-        """Get current state for debugging."""
-        return {
+        """Get current state for debugging.
+
+        The snapshot is cached until the next event or reset; treat it as read-only.
+        """
+        if self._state_snapshot is not None:
+            return self._state_snapshot
+        self._state_snapshot = {
             "blocks": [
                 {
                     "type": b.block_type,
-                    "content_length": len(b.content),
+                    "content_length": b.content_length,
                     "is_streaming": b.is_streaming,
                     "order": b.order,
                 }
@@ -253,6 +389,7 @@ class ContentProcessor(EventProcessor):
             "is_streaming": self._state.is_streaming,
             "block_count": len(self._state.blocks),
         }
+        return self._state_snapshot
 
     @property
     def is_streaming(self) -> bool:
@@ -9,11 +9,13 @@ The router is the central hub that:
 
 from __future__ import annotations
 
+import sys
+import weakref
 from typing import TYPE_CHECKING, Any
 
 from .agent import AgentProcessor
 from .approval import ApprovalProcessor
-from .base import EventProcessor, ProcessorResult
+from .base import UNHANDLED_RESULT, EventProcessor, ProcessorResult
 from .content import ContentProcessor
 from .session import SessionProcessor
 from .todo import TodoProcessor
@@ -36,7 +38,10 @@ class EventRouter:
         Args:
             app: The TUI application instance. Can be None for testing.
         """
-        self._app = app
+        # Weak like the processors' back-references, so the router doesn't pin the app
+        self._app_ref: weakref.ref[AmplifierTUI] | None = (
+            weakref.ref(app) if app is not None else None
+        )
 
         # Initialize all processors
         self._content = ContentProcessor(app)
@@ -56,9 +61,21 @@ class EventRouter:
             self._session,
         ]
 
+        # Event type -> processor, so routing is one dict lookup. Processors that
+        # don't declare HANDLED_EVENTS are still asked via handles() on a miss.
+        self._event_map: dict[str, EventProcessor] = {}
+        self._fallback_processors: list[EventProcessor] = []
+        for processor in self._processors:
+            handled_events = getattr(processor, "HANDLED_EVENTS", None)
+            if handled_events is None:
+                self._fallback_processors.append(processor)
+                continue
+            for handled in handled_events:
+                self._event_map.setdefault(handled, processor)
+
     def set_app(self, app: AmplifierTUI) -> None:
         """Set the app instance on all processors."""
-        self._app = app
+        self._app_ref = weakref.ref(app)
         for processor in self._processors:
             processor.set_app(app)
 
@@ -72,6 +89,9 @@ class EventRouter:
         Returns:
             ProcessorResult from the handling processor, or a not-handled result
         """
+        # Interned once here so every processor's set/dict lookup hits the identity fast path
+        event_type = sys.intern(event_type)
+
         # Check for sub-session events first
         # If it's a sub-session event, we might need special routing
         if self._agent.is_sub_session_event(data):
@@ -83,20 +103,43 @@ class EventRouter:
                     data["parent_tool_call_id"] = parent_tool_call_id
 
         # Find processor that handles this event type
-        for processor in self._processors:
+        processor = self._event_map.get(event_type)
+        if processor is not self._content:
+            # Buffered text must reach the UI before anything another processor renders
+            self._content.flush_pending()
+        if processor is not None:
+            result = self._process(processor, event_type, data)
+            if result.handled:
+                return result
+
+        for processor in self._fallback_processors:
             if processor.handles(event_type):
-                result = processor.process(event_type, data)
+                result = self._process(processor, event_type, data)
                 if result.handled:
                     return result
 
         # No processor handled the event
-        return ProcessorResult(handled=False)
+        return UNHANDLED_RESULT
+
+    def _process(
+        self, processor: EventProcessor, event_type: str, data: dict[str, Any]
+    ) -> ProcessorResult:
+        """Run a processor with its app calls coalesced into a single repaint."""
+        app = self._app_ref() if self._app_ref is not None else None
+        if app is None:
+            return processor.process(event_type, data)
+        with app.batch_update():
+            return processor.process(event_type, data)
 
     def reset(self) -> None:
         """Reset all processor states."""
         for processor in self._processors:
             processor.reset()
 
+    def flush_content(self) -> None:
+        """Send any buffered content deltas to the UI."""
+        self._content.flush_pending()
+
     def reset_content_block_mapping(self) -> None:
         """Reset content block index mapping.
 
@@ -163,13 +206,17 @@ class EventRouter:
         item = self._todo.in_progress_item
         return item.active_form if item else None
 
-    def get_all_state(self) -> dict[str, Any]:
-        """Get state from all processors for debugging."""
+    def get_all_state(self, verbose: bool = False) -> dict[str, Any]:
+        """Get state from all processors for debugging.
+
+        Args:
+            verbose: Include per-item detail from the agent and approval processors
+        """
         return {
             "content": self._content.get_state(),
             "tool": self._tool.get_state(),
             "todo": self._todo.get_state(),
-            "agent": self._agent.get_state(),
-            "approval": self._approval.get_state(),
+            "agent": self._agent.get_state(verbose=verbose),
+            "approval": self._approval.get_state(verbose=verbose),
             "session": self._session.get_state(),
         }
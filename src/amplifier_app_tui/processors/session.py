@@ -10,13 +10,15 @@ Tracks overall session state.
 
 from __future__ import annotations
 
+import sys
+from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Any
 
-from .base import EventProcessor, ProcessorAction, ProcessorResult
+from .base import UNHANDLED_RESULT, EventProcessor, ProcessorAction, ProcessorResult
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionState:
     """State for session processing."""
 
@@ -33,33 +35,36 @@ class SessionProcessor(EventProcessor):
 
     # Event types this processor handles
     HANDLED_EVENTS = frozenset(
-        [
-            "prompt_complete",
-            "error",
-            "display_message",
-            "prompt:complete",
-        ]
+        map(
+            sys.intern,
+            [
+                "prompt_complete",
+                "error",
+                "display_message",
+                "prompt:complete",
+            ],
+        )
     )
 
     def __init__(self, app: Any = None) -> None:
         super().__init__(app)
         self._state = SessionState()
+        self._handlers: dict[str, Callable[[dict[str, Any]], ProcessorResult]] = {
+            "prompt_complete": self._handle_prompt_complete,
+            "prompt:complete": self._handle_prompt_complete,
+            "error": self._handle_error,
+            "display_message": self._handle_display_message,
+        }
 
     def handles(self, event_type: str) -> bool:
         return event_type in self.HANDLED_EVENTS
 
     def process(self, event_type: str, data: dict[str, Any]) -> ProcessorResult:
         """Process a session event."""
-        normalized = event_type.replace(":", "_")
-
-        if normalized == "prompt_complete":
-            return self._handle_prompt_complete(data)
-        elif normalized == "error":
-            return self._handle_error(data)
-        elif normalized == "display_message":
-            return self._handle_display_message(data)
-
-        return ProcessorResult(handled=False)
+        handler = self._handlers.get(event_type)
+        if handler is None:
+            return UNHANDLED_RESULT
+        return handler(data)
 
     def _handle_prompt_complete(self, data: dict[str, Any]) -> ProcessorResult:
         """Handle prompt complete event."""
@@ -68,9 +73,9 @@ class SessionProcessor(EventProcessor):
         self._state.status = "idle"
 
         # Update UI if app available
-        if self._app:
-            self._app.end_response()
-            self._app.set_agent_state("idle")
+        if app := self._app:
+            app.end_response()
+            app.set_agent_state("idle")
 
         return ProcessorResult(
             handled=True,
@@ -86,9 +91,9 @@ class SessionProcessor(EventProcessor):
         self._state.status = "error"
 
         # Update UI if app available
-        if self._app:
-            self._app.add_error(error)
-            self._app.set_agent_state("idle")
+        if app := self._app:
+            app.add_error(error)
+            app.set_agent_state("idle")
 
         return ProcessorResult(
             handled=True,
@@ -104,11 +109,11 @@ class SessionProcessor(EventProcessor):
         source = data.get("source")
 
         # Update UI if app available
-        if self._app:
+        if app := self._app:
             if level == "error":
-                self._app.add_error(message)
+                app.add_error(message)
             else:
-                self._app.add_system_message(message)
+                app.add_system_message(message)
 
         return ProcessorResult(
             handled=True,
@@ -9,13 +9,32 @@ Maintains state for the current todo list.
 
 from __future__ import annotations
 
+import sys
+import time
+from collections import Counter
 from dataclasses import dataclass, field
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from .base import EventProcessor, ProcessorAction, ProcessorResult
 
+if TYPE_CHECKING:
+    from ..widgets.todos import TodoPanel
 
-@dataclass
+# Widget class resolved on first UI update, keeping processors importable without Textual
+_TodoPanel: type[TodoPanel] | None = None
+
+
+def _get_todo_panel_cls() -> type[TodoPanel]:
+    """Import TodoPanel once and cache it for later updates."""
+    global _TodoPanel
+    if _TodoPanel is None:
+        from ..widgets.todos import TodoPanel
+
+        _TodoPanel = TodoPanel
+    return _TodoPanel
+
+
+@dataclass(slots=True)
 class TodoItem:
     """A todo item."""
 
@@ -24,11 +43,13 @@ class TodoItem:
     active_form: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class TodoState:
     """State for todo processing."""
 
     items: list[TodoItem] = field(default_factory=list)
+    status_counts: Counter[str] = field(default_factory=Counter)
+    panel_items: list[dict[str, Any]] = field(default_factory=list)  # TodoPanel format
     last_update_time: float = 0
 
 
@@ -41,21 +62,27 @@ class TodoProcessor(EventProcessor):
 
     # Event types this processor handles
     HANDLED_EVENTS = frozenset(
-        [
-            "todo:update",
-            "todo_update",
-        ]
+        map(
+            sys.intern,
+            [
+                "todo:update",
+                "todo_update",
+            ],
+        )
     )
 
     def __init__(self, app: Any = None) -> None:
         super().__init__(app)
         self._state = TodoState()
+        # get_state() result, rebuilt only after an event or reset changes state
+        self._state_snapshot: dict[str, Any] | None = None
 
     def handles(self, event_type: str) -> bool:
         return event_type in self.HANDLED_EVENTS
 
     def process(self, event_type: str, data: dict[str, Any]) -> ProcessorResult:
         """Process a todo event."""
+        self._state_snapshot = None
         return self._handle_todo_update(data)
 
     def _handle_todo_update(self, data: dict[str, Any]) -> ProcessorResult:
@@ -65,25 +92,31 @@ class TodoProcessor(EventProcessor):
         todos_data = data.get("todos", [])
         action = data.get("action", "update")
 
-        # Parse todo items
+        # Parse todo items, building the panel format and status counts in the same pass
         new_items: list[TodoItem] = []
+        panel_items: list[dict[str, Any]] = []
+        counts: Counter[str] = Counter()
         for item in todos_data:
             if isinstance(item, dict):
-                new_items.append(
-                    TodoItem(
-                        content=item.get("content", ""),
-                        status=item.get("status", "pending"),
-                        active_form=item.get("activeForm", item.get("active_form", "")),
-                    )
+                todo = TodoItem(
+                    content=item.get("content", ""),
+                    status=item.get("status", "pending"),
+                    active_form=item.get("activeForm") or item.get("active_form") or "",
                 )
+                new_items.append(todo)
+                panel_items.append(
+                    {
+                        "content": todo.content,
+                        "status": todo.status,
+                        "activeForm": todo.active_form,
+                    }
+                )
+                counts[todo.status] += 1
 
-        # Update state
-        if action == "create":
-            self._state.items = new_items
-        else:
-            self._state.items = new_items
-
-        import time
+        # Update state (create and update both replace the list)
+        self._state.items = new_items
+        self._state.panel_items = panel_items
+        self._state.status_counts = counts
 
         self._state.last_update_time = time.time()
 
@@ -97,33 +130,23 @@ class TodoProcessor(EventProcessor):
             data={
                 "action": action,
                 "todo_count": len(new_items),
-                "pending": sum(1 for t in new_items if t.status == "pending"),
-                "in_progress": sum(1 for t in new_items if t.status == "in_progress"),
-                "completed": sum(1 for t in new_items if t.status == "completed"),
+                "pending": counts["pending"],
+                "in_progress": counts["in_progress"],
+                "completed": counts["completed"],
             },
         )
 
     def _update_todo_panel(self) -> None:
         """Update the todo panel in the UI."""
-        if not self._app:
+        app = self._app
+        if not app:
             return
 
         # Try to get the todo panel
         try:
-            from ..widgets.todos import TodoPanel
-
-            todo_panel = self._app.query_one(TodoPanel)
+            todo_panel = app.query_one(_get_todo_panel_cls())
             if todo_panel:
-                # Convert items to the format the panel expects
-                items = [
-                    {
-                        "content": item.content,
-                        "status": item.status,
-                        "activeForm": item.active_form,
-                    }
-                    for item in self._state.items
-                ]
-                todo_panel.update_todos(items)
+                todo_panel.update_todos(self._state.panel_items)
         except Exception:
             # Panel not available or not mounted
             pass
@@ -131,11 +154,18 @@ class TodoProcessor(EventProcessor):
     def reset(self) -> None:
         """Reset todo state for new session."""
         self._state = TodoState()
+        self._state_snapshot = None
         return None
 
     def get_state(self) -> dict[str, Any]:
-        """Get current state for debugging."""
-        return {
+        """Get current state for debugging.
+
+        The snapshot is cached until the next event or reset; treat it as read-only.
+        """
+        if self._state_snapshot is not None:
+            return self._state_snapshot
+        counts = self._state.status_counts
+        self._state_snapshot = {
             "items": [
                 {
                     "content": item.content,
@@ -144,10 +174,11 @@ class TodoProcessor(EventProcessor):
                 for item in self._state.items
             ],
             "count": len(self._state.items),
-            "pending": sum(1 for t in self._state.items if t.status == "pending"),
-            "in_progress": sum(1 for t in self._state.items if t.status == "in_progress"),
-            "completed": sum(1 for t in self._state.items if t.status == "completed"),
+            "pending": counts["pending"],
+            "in_progress": counts["in_progress"],
+            "completed": counts["completed"],
         }
+        return self._state_snapshot
 
     @property
     def items(self) -> list[TodoItem]:
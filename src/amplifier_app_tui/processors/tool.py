@@ -11,13 +11,21 @@ Based on amplifier-web's tool handling patterns.
 
 from __future__ import annotations
 
+import sys
+from collections import deque
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from typing import Any
 
-from .base import EventProcessor, ProcessorAction, ProcessorResult
+from .base import UNHANDLED_RESULT, EventProcessor, ProcessorAction, ProcessorResult
 
+# Finished calls kept for inspection; older ones drop off so long sessions stay bounded
+_COMPLETED_CAPACITY = 1024
+# Result text kept on a finished call; the UI already has the full output
+_RETAINED_RESULT_CHARS = 4096
 
-@dataclass
+
+@dataclass(slots=True)
 class ToolCall:
     """A tool call in progress or completed."""
 
@@ -36,12 +44,15 @@ class ToolCall:
     nesting_depth: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolState:
     """State for tool processing."""
 
     active_calls: dict[str, ToolCall] = field(default_factory=dict)  # tool_call_id -> ToolCall
-    completed_calls: list[ToolCall] = field(default_factory=list)
+    completed_calls: deque[ToolCall] = field(
+        default_factory=lambda: deque(maxlen=_COMPLETED_CAPACITY)
+    )
+    completed_count: int = 0  # total finished, including calls evicted from the buffer
     order_counter: int = 0
 
 
@@ -54,45 +65,56 @@ class ToolProcessor(EventProcessor):
 
     # Event types this processor handles
     HANDLED_EVENTS = frozenset(
-        [
-            # Tool events (runtime normalized format)
-            "tool_call",
-            "tool_result",
-            "tool_error",
-            # Alternative formats (amplifier-core format)
-            "tool:pre",
-            "tool:post",
-            "tool:error",
-        ]
+        map(
+            sys.intern,
+            [
+                # Tool events (runtime normalized format)
+                "tool_call",
+                "tool_result",
+                "tool_error",
+                # Alternative formats (amplifier-core format)
+                "tool:pre",
+                "tool:post",
+                "tool:error",
+            ],
+        )
     )
 
     def __init__(self, app: Any = None) -> None:
         super().__init__(app)
         self._state = ToolState()
+        self._handlers: dict[str, Callable[[dict[str, Any]], ProcessorResult]] = {
+            "tool_call": self._handle_tool_call,
+            "tool:pre": self._handle_tool_call,
+            "tool_result": self._handle_tool_result,
+            "tool:post": self._handle_tool_result,
+            "tool_error": self._handle_tool_error,
+            "tool:error": self._handle_tool_error,
+        }
 
     def handles(self, event_type: str) -> bool:
         return event_type in self.HANDLED_EVENTS
 
     def process(self, event_type: str, data: dict[str, Any]) -> ProcessorResult:
         """Process a tool event."""
-        # Normalize event type
-        normalized = event_type.replace(":", "_")
-
-        if normalized in ("tool_call", "tool_pre"):
-            return self._handle_tool_call(data)
-        elif normalized in ("tool_result", "tool_post"):
-            return self._handle_tool_result(data)
-        elif normalized in ("tool_error",):
-            return self._handle_tool_error(data)
-
-        return ProcessorResult(handled=False)
+        handler = self._handlers.get(event_type)
+        if handler is None:
+            return UNHANDLED_RESULT
+        return handler(data)
 
     def _handle_tool_call(self, data: dict[str, Any]) -> ProcessorResult:
         """Handle tool call start."""
         tool_call_id = data.get("tool_call_id", "")
         tool_name = data.get("tool_name", data.get("name", "unknown"))
         arguments = data.get("arguments", data.get("input", {}))
+        if not isinstance(arguments, dict):
+            arguments = {}
         status = data.get("status", "running")
+        # Few distinct names/statuses recur across many calls; share one string each
+        if isinstance(tool_name, str):
+            tool_name = sys.intern(tool_name)
+        if isinstance(status, str):
+            status = sys.intern(status)
 
         # Sub-session context
         child_session_id = data.get("child_session_id")
@@ -103,7 +125,7 @@ class ToolProcessor(EventProcessor):
         tool_call = ToolCall(
             tool_call_id=tool_call_id,
             tool_name=tool_name,
-            arguments=arguments if isinstance(arguments, dict) else {},
+            arguments=arguments,
             status=status,
             order=self._state.order_counter,
             child_session_id=child_session_id,
@@ -114,10 +136,10 @@ class ToolProcessor(EventProcessor):
         self._state.active_calls[tool_call_id] = tool_call
 
         # Update UI if app available
-        if self._app:
-            ui_block_id = self._app.add_tool_call(
+        if app := self._app:
+            ui_block_id = app.add_tool_call(
                 tool_name=tool_name,
-                params=arguments if isinstance(arguments, dict) else {},
+                params=arguments,
                 result=None,
                 status=status,
             )
@@ -139,23 +161,22 @@ class ToolProcessor(EventProcessor):
         output = data.get("output", data.get("result", ""))
         success = data.get("success", True)
         error = data.get("error")
+        result_text = output if isinstance(output, str) else str(output)
 
-        # Update tool call record
-        tool_call = self._state.active_calls.get(tool_call_id)
+        # Update tool call record, moving it from active to completed
+        tool_call = self._state.active_calls.pop(tool_call_id, None)
         if tool_call:
             tool_call.status = "complete" if success else "error"
-            tool_call.result = output if isinstance(output, str) else str(output)
+            tool_call.result = result_text
             tool_call.error = error
-            # Move to completed
-            self._state.completed_calls.append(tool_call)
-            del self._state.active_calls[tool_call_id]
+            self._complete(tool_call)
 
         # Update UI if app available
-        if self._app and tool_call and tool_call.ui_block_id:
+        if (app := self._app) and tool_call and tool_call.ui_block_id:
             status_str = "success" if success else "error"
-            self._app.update_tool_call(
+            app.update_tool_call(
                 block_id=tool_call.ui_block_id,
-                result=output if isinstance(output, str) else str(output),
+                result=result_text,
                 status=status_str,
             )
 
@@ -174,17 +195,16 @@ class ToolProcessor(EventProcessor):
         tool_call_id = data.get("tool_call_id", "")
         error = data.get("error", "Unknown error")
 
-        # Update tool call record
-        tool_call = self._state.active_calls.get(tool_call_id)
+        # Update tool call record, moving it from active to completed
+        tool_call = self._state.active_calls.pop(tool_call_id, None)
         if tool_call:
             tool_call.status = "error"
             tool_call.error = error
-            self._state.completed_calls.append(tool_call)
-            del self._state.active_calls[tool_call_id]
+            self._complete(tool_call)
 
         # Update UI if app available
-        if self._app and tool_call and tool_call.ui_block_id:
-            self._app.update_tool_call(
+        if (app := self._app) and tool_call and tool_call.ui_block_id:
+            app.update_tool_call(
                 block_id=tool_call.ui_block_id,
                 result=str(error),
                 status="error",
@@ -197,6 +217,15 @@ class ToolProcessor(EventProcessor):
             data={"tool_call_id": tool_call_id, "error": error},
         )
 
+    def _complete(self, tool_call: ToolCall) -> None:
+        """Record a finished call, dropping what only an in-flight call needs."""
+        tool_call.arguments = {}
+        result = tool_call.result
+        if result is not None and len(result) > _RETAINED_RESULT_CHARS:
+            tool_call.result = result[:_RETAINED_RESULT_CHARS] + "...[truncated]"
+        self._state.completed_calls.append(tool_call)
+        self._state.completed_count += 1
+
     def reset(self) -> None:
         """Reset tool state for new session."""
         self._state = ToolState()
@@ -213,7 +242,7 @@ class ToolProcessor(EventProcessor):
                 }
                 for k, v in self._state.active_calls.items()
             },
-            "completed_count": len(self._state.completed_calls),
+            "completed_count": self._state.completed_count,
             "active_count": len(self._state.active_calls),
         }
 
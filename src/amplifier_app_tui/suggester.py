@@ -8,8 +8,12 @@ Provides intelligent completions for:
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import TYPE_CHECKING
+import asyncio
+import bisect
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
 
 from textual.suggester import Suggester
 
@@ -17,14 +21,14 @@ if TYPE_CHECKING:
     from .bridge import RuntimeBridge
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CommandSpec:
     """Specification for a command's completions."""
 
     name: str
-    aliases: list[str] = field(default_factory=list)
-    subcommands: list[str] = field(default_factory=list)
-    flags: list[str] = field(default_factory=list)
+    aliases: tuple[str, ...] = ()
+    subcommands: tuple[str, ...] = ()
+    flags: tuple[str, ...] = ()
     # For dynamic completions (e.g., bundle names)
     dynamic_arg: str | None = None  # "bundles", "sessions", etc.
 
@@ -33,34 +37,37 @@ class CommandSpec:
 COMMANDS: dict[str, CommandSpec] = {
     "help": CommandSpec(
         name="help",
-        aliases=["h", "?"],
-        subcommands=["bundle", "reset", "session", "config", "clear", "quit"],
+        aliases=("h", "?"),
+        subcommands=("bundle", "reset", "session", "config", "clear", "quit"),
     ),
     "bundle": CommandSpec(
         name="bundle",
-        aliases=["b"],
-        subcommands=["list", "ls", "info", "install", "add", "remove", "rm", "use"],
-        flags=["--name"],
+        aliases=("b",),
+        subcommands=("list", "ls", "info", "install", "add", "remove", "rm", "use"),
+        flags=("--name",),
         dynamic_arg="bundles",  # For info, use, remove
     ),
     "reset": CommandSpec(
         name="reset",
-        flags=["--bundle", "--preserve"],
+        flags=("--bundle", "--preserve"),
         dynamic_arg="bundles",  # For --bundle value
     ),
     "session": CommandSpec(
         name="session",
-        subcommands=["list"],
+        subcommands=("list",),
         dynamic_arg="sessions",
     ),
     "config": CommandSpec(
         name="config",
-        subcommands=["providers"],
+        subcommands=("providers",),
     ),
     "clear": CommandSpec(name="clear"),
-    "quit": CommandSpec(name="quit", aliases=["exit", "q"]),
+    "quit": CommandSpec(name="quit", aliases=("exit", "q")),
 }
 
+# Seconds a fetched bundle/session/agent/tool list is trusted before refetching
+_CACHE_TTL = 5.0
+
 # Build alias -> canonical name mapping
 ALIAS_MAP: dict[str, str] = {}
 for cmd_name, spec in COMMANDS.items():
@@ -69,6 +76,25 @@ for cmd_name, spec in COMMANDS.items():
         ALIAS_MAP[alias] = cmd_name
 
 
+def _build_command_index(
+    commands: dict[str, CommandSpec], alias_map: dict[str, str]
+) -> tuple[list[str], list[tuple[str, str]]]:
+    """Sort command names and alias-only (alias, canonical) pairs for bisect lookups."""
+    names = sorted(commands)
+    aliases = sorted(
+        (alias, canonical) for alias, canonical in alias_map.items() if alias not in commands
+    )
+    return names, aliases
+
+
+def _replace_tail(value: str, partial: str, completion: str) -> str:
+    """Replace the partial word at the end of value with its completion."""
+    if value.endswith(partial):
+        return value[: len(value) - len(partial)] + completion
+    # Partial isn't the literal tail (e.g. trailing tab); cut at its last occurrence
+    return value.rsplit(partial, 1)[0] + completion
+
+
 class CommandSuggester(Suggester):
     """Intelligent suggester for slash commands and @agent mentions.
 
@@ -94,9 +120,22 @@ class CommandSuggester(Suggester):
         self._cached_sessions: list[str] | None = None
         self._cached_agents: list[str] | None = None
         self._cached_tools: list[str] | None = None
+        self._cached_bundles_at = 0.0
+        self._cached_sessions_at = 0.0
+        self._cached_agents_at = 0.0
+        self._cached_tools_at = 0.0
+        # (name, name.casefold()) pairs for case-insensitive mention matching
+        self._cached_agent_pairs: list[tuple[str, str]] | None = None
+        self._cached_tool_pairs: list[tuple[str, str]] | None = None
         # Dynamic commands from runtime
         self._cached_commands: dict[str, CommandSpec] | None = None
         self._cached_alias_map: dict[str, str] | None = None
+        self._cached_command_index: tuple[list[str], list[tuple[str, str]]] | None = None
+        self._prewarm_task: asyncio.Task[None] | None = None
+        # In-flight runtime fetches by cache key, shared by concurrent keystrokes
+        self._inflight: dict[str, asyncio.Future[Any]] = {}
+        # Bumped per get_suggestion call; older calls bail out after their awaits
+        self._req_seq = 0
 
     def set_bridge(self, bridge: RuntimeBridge) -> None:
         """Set the runtime bridge for dynamic completions."""
@@ -106,68 +145,123 @@ class CommandSuggester(Suggester):
         self._cached_sessions = None
         self._cached_agents = None
         self._cached_tools = None
+        self._cached_agent_pairs = None
+        self._cached_tool_pairs = None
         self._cached_commands = None
         self._cached_alias_map = None
+        self._cached_command_index = None
+
+        # Fill the caches in the background so the first keystroke doesn't wait on them
+        if bridge.is_connected:
+            try:
+                self._prewarm_task = asyncio.get_running_loop().create_task(self.prewarm())
+            except RuntimeError:
+                pass  # No running loop; caches fill on first use instead
+
+    async def prewarm(self) -> None:
+        """Fetch all dynamic completion data concurrently.
+
+        Each fetcher handles its own errors, so a failing lookup just
+        leaves that cache empty.
+        """
+        await asyncio.gather(
+            self._get_bundles(),
+            self._get_sessions(),
+            self._get_agents(),
+            self._get_tools(),
+            self._get_commands(),
+            return_exceptions=True,
+        )
+
+    async def _fetch_once(self, key: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """Run a runtime fetch, sharing one in-flight call between concurrent callers.
+
+        The shared call is shielded, so a cancelled suggestion doesn't cancel
+        the fetch for the others waiting on it.
+        """
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(fetch())
+            self._inflight[key] = future
+            future.add_done_callback(lambda _f: self._inflight.pop(key, None))
+        return await asyncio.shield(future)
 
     async def _get_bundles(self) -> list[str]:
-        """Get available bundle names."""
-        if self._cached_bundles is not None:
+        """Get available bundle names (cached for _CACHE_TTL seconds)."""
+        now = time.monotonic()
+        if self._cached_bundles is not None and now - self._cached_bundles_at < _CACHE_TTL:
             return self._cached_bundles
 
+        # Past the TTL, a stale list still beats nothing if the refetch can't happen
         if not self._bridge or not self._bridge.is_connected:
-            return []
+            return self._cached_bundles or []
 
         try:
-            bundles = await self._bridge._client.bundle.list()
+            bundles = await self._fetch_once("bundles", self._bridge._client.bundle.list)
             self._cached_bundles = [b.get("name", "") for b in bundles if b.get("name")]
+            self._cached_bundles_at = now
             return self._cached_bundles
         except Exception:
-            return []
+            return self._cached_bundles or []
 
     async def _get_sessions(self) -> list[str]:
-        """Get available session IDs."""
-        if self._cached_sessions is not None:
+        """Get available session IDs (cached for _CACHE_TTL seconds)."""
+        now = time.monotonic()
+        if self._cached_sessions is not None and now - self._cached_sessions_at < _CACHE_TTL:
             return self._cached_sessions
 
         if not self._bridge or not self._bridge.is_connected:
-            return []
+            return self._cached_sessions or []
 
         try:
-            sessions = await self._bridge._client.session.list()
+            sessions = await self._fetch_once("sessions", self._bridge._client.session.list)
             self._cached_sessions = [s.session_id for s in sessions]
+            self._cached_sessions_at = now
             return self._cached_sessions
         except Exception:
-            return []
+            return self._cached_sessions or []
 
     async def _get_agents(self) -> list[str]:
-        """Get available agent names."""
-        if self._cached_agents is not None:
+        """Get available agent names (cached for _CACHE_TTL seconds)."""
+        now = time.monotonic()
+        if self._cached_agents is not None and now - self._cached_agents_at < _CACHE_TTL:
             return self._cached_agents
 
         if not self._bridge or not self._bridge.is_connected:
-            return []
+            return self._cached_agents or []
 
+        bridge = self._bridge
         try:
-            agents = await self._bridge._client.agents.list(self._bridge.session_id)
+            agents = await self._fetch_once(
+                "agents", lambda: bridge._client.agents.list(bridge.session_id)
+            )
             self._cached_agents = [a.get("name", "") for a in agents if a.get("name")]
+            self._cached_agent_pairs = [(a, a.casefold()) for a in self._cached_agents]
+            self._cached_agents_at = now
             return self._cached_agents
         except Exception:
-            return []
+            return self._cached_agents or []
 
     async def _get_tools(self) -> list[str]:
-        """Get available tool names for completion."""
-        if self._cached_tools is not None:
+        """Get available tool names for completion (cached for _CACHE_TTL seconds)."""
+        now = time.monotonic()
+        if self._cached_tools is not None and now - self._cached_tools_at < _CACHE_TTL:
             return self._cached_tools
 
         if not self._bridge or not self._bridge.is_connected:
-            return []
+            return self._cached_tools or []
 
+        bridge = self._bridge
         try:
-            tools = await self._bridge._client.tools.list(self._bridge.session_id)
+            tools = await self._fetch_once(
+                "tools", lambda: bridge._client.tools.list(bridge.session_id)
+            )
             self._cached_tools = [t.get("name", "") for t in tools if t.get("name")]
+            self._cached_tool_pairs = [(t, t.casefold()) for t in self._cached_tools]
+            self._cached_tools_at = now
             return self._cached_tools
         except Exception:
-            return []
+            return self._cached_tools or []
 
     def invalidate_cache(self) -> None:
         """Clear cached dynamic values."""
@@ -175,8 +269,11 @@ class CommandSuggester(Suggester):
         self._cached_sessions = None
         self._cached_agents = None
         self._cached_tools = None
+        self._cached_agent_pairs = None
+        self._cached_tool_pairs = None
         self._cached_commands = None
         self._cached_alias_map = None
+        self._cached_command_index = None
 
     async def _get_commands(self) -> tuple[dict[str, CommandSpec], dict[str, str]]:
         """Get commands and alias map, fetching from runtime if connected."""
@@ -190,7 +287,7 @@ class CommandSuggester(Suggester):
         if self._bridge and self._bridge.is_connected:
             try:
                 # Fetch from runtime
-                data = await self._bridge._client.slash_commands.list()
+                data = await self._fetch_once("commands", self._bridge._client.slash_commands.list)
                 runtime_commands = data.get("commands", [])
                 mode_shortcuts = data.get("mode_shortcuts", [])
 
@@ -207,9 +304,9 @@ class CommandSuggester(Suggester):
 
                     spec = CommandSpec(
                         name=name,
-                        aliases=cmd.get("aliases", []),
-                        subcommands=subcommands,
-                        flags=cmd.get("flags", []),
+                        aliases=tuple(cmd.get("aliases") or ()),
+                        subcommands=tuple(subcommands),
+                        flags=tuple(cmd.get("flags") or ()),
                         dynamic_arg=cmd.get("dynamic_arg"),
                     )
                     commands[name] = spec
@@ -223,7 +320,7 @@ class CommandSuggester(Suggester):
                 for mode in mode_shortcuts:
                     name = mode.get("name", "")
                     if name:
-                        commands[name] = CommandSpec(name=name, aliases=[])
+                        commands[name] = CommandSpec(name=name)
                         alias_map[name] = name
 
             except Exception:
@@ -231,6 +328,7 @@ class CommandSuggester(Suggester):
 
         self._cached_commands = commands
         self._cached_alias_map = alias_map
+        self._cached_command_index = _build_command_index(commands, alias_map)
         return commands, alias_map
 
     async def get_suggestion(self, value: str) -> str | None:
@@ -242,15 +340,26 @@ class CommandSuggester(Suggester):
         Returns:
             Suggested completion or None
         """
+        # A newer keystroke supersedes this call; checked after each await
+        self._req_seq += 1
+        seq = self._req_seq
+
+        # Cheap substring prechecks keep plain typing away from the agent/tool lookups
         # Check for @agent completion anywhere in the input
-        agent_suggestion = await self._complete_agent_mention(value)
-        if agent_suggestion:
-            return agent_suggestion
+        if "@" in value:
+            agent_suggestion = await self._complete_agent_mention(value)
+            if agent_suggestion:
+                return agent_suggestion
+            if seq != self._req_seq:
+                return None
 
         # Check for tool name completion (e.g., "tool-bas" -> "tool-bash")
-        tool_suggestion = await self._complete_tool_mention(value)
-        if tool_suggestion:
-            return tool_suggestion
+        if "tool-" in value or "tool_" in value:
+            tool_suggestion = await self._complete_tool_mention(value)
+            if tool_suggestion:
+                return tool_suggestion
+            if seq != self._req_seq:
+                return None
 
         # Check for slash command completion
         if not value.startswith("/"):
@@ -258,6 +367,7 @@ class CommandSuggester(Suggester):
 
         # Parse current input
         parts = value[1:].split()  # Remove leading /
+        ends_with_space = value.endswith(" ")
 
         if not parts:
             # Just "/" - suggest first command
@@ -268,9 +378,11 @@ class CommandSuggester(Suggester):
 
         # Get dynamic commands
         commands, alias_map = await self._get_commands()
+        if seq != self._req_seq:
+            return None
 
         # Case 1: Still typing the command name
-        if len(parts) == 1 and not value.endswith(" "):
+        if len(parts) == 1 and not ends_with_space:
             return await self._complete_command(cmd_text, commands, alias_map)
 
         # Case 2: Command complete, looking for subcommand/flag/arg
@@ -281,9 +393,8 @@ class CommandSuggester(Suggester):
         spec = commands[canonical]
 
         # What comes after the command?
-        remaining = parts[1:] if len(parts) > 1 else []
+        remaining = parts[1:]
         last_part = remaining[-1] if remaining else ""
-        ends_with_space = value.endswith(" ")
 
         # Case 2a: Looking for subcommand
         if not remaining or (len(remaining) == 1 and not ends_with_space):
@@ -344,17 +455,19 @@ class CommandSuggester(Suggester):
 
         # Get available agents
         agents = await self._get_agents()
-        if not agents:
+        if not agents or not self._cached_agent_pairs:
             return None
 
-        # Find matching agent
-        partial_lower = partial.lower()
-        matches = [a for a in agents if a.lower().startswith(partial_lower)]
+        # Find first matching agent
+        partial_cf = partial.casefold()
+        match = next(
+            (a for a, folded in self._cached_agent_pairs if folded.startswith(partial_cf)), None
+        )
 
-        if matches:
+        if match:
             # Return full input with completed agent name
             prefix = value[:at_pos]
-            return f"{prefix}@{matches[0]}"
+            return f"{prefix}@{match}"
 
         return None
 
@@ -385,17 +498,19 @@ class CommandSuggester(Suggester):
 
         # Get available tools
         tools = await self._get_tools()
-        if not tools:
+        if not tools or not self._cached_tool_pairs:
             return None
 
-        # Find matching tool
-        partial_lower = last_word.lower()
-        matches = [t for t in tools if t.lower().startswith(partial_lower)]
+        # Find first matching tool
+        partial_cf = last_word.casefold()
+        match = next(
+            (t for t, folded in self._cached_tool_pairs if folded.startswith(partial_cf)), None
+        )
 
-        if matches:
+        if match:
             # Return full input with completed tool name
             prefix = value[: value.rfind(last_word)]
-            return f"{prefix}{matches[0]}"
+            return f"{prefix}{match}"
 
         return None
 
@@ -411,19 +526,25 @@ class CommandSuggester(Suggester):
             canonical = alias_map[partial]
             return f"/{canonical}"
 
-        # Check all commands (prefer canonical names over aliases)
-        canonical_matches = [cmd for cmd in commands if cmd.startswith(partial)]
-        if canonical_matches:
-            return f"/{sorted(canonical_matches)[0]}"
+        names, aliases = self._cached_command_index or _build_command_index(commands, alias_map)
+
+        # Check all commands (prefer canonical names over aliases); the first
+        # name at or after the partial is the smallest match, if any
+        i = bisect.bisect_left(names, partial)
+        if i < len(names) and names[i].startswith(partial):
+            return f"/{names[i]}"
 
-        # Check aliases
-        alias_matches = []
-        for alias, canonical in alias_map.items():
-            if alias.startswith(partial) and alias not in commands:
-                alias_matches.append(canonical)
+        # Check aliases - matching ones are contiguous; suggest the smallest canonical
+        best: str | None = None
+        i = bisect.bisect_left(aliases, (partial,))
+        while i < len(aliases) and aliases[i][0].startswith(partial):
+            canonical = aliases[i][1]
+            if best is None or canonical < best:
+                best = canonical
+            i += 1
 
-        if alias_matches:
-            return f"/{sorted(set(alias_matches))[0]}"
+        if best is not None:
+            return f"/{best}"
 
         return None
 
@@ -444,20 +565,18 @@ class CommandSuggester(Suggester):
                 return f"{value}{spec.subcommands[0]}"
         else:
             # Complete partial subcommand
-            matches = [sub for sub in spec.subcommands if sub.startswith(partial)]
-            if matches:
+            match = next((sub for sub in spec.subcommands if sub.startswith(partial)), None)
+            if match is not None:
                 # Replace partial with complete subcommand
-                base = value.rsplit(partial, 1)[0]
-                return f"{base}{matches[0]}"
+                return _replace_tail(value, partial, match)
 
         return None
 
     def _complete_flag(self, value: str, spec: CommandSpec, partial: str) -> str | None:
         """Complete a flag."""
-        matches = [f for f in spec.flags if f.startswith(partial)]
-        if matches:
-            base = value.rsplit(partial, 1)[0]
-            return f"{base}{matches[0]}"
+        match = next((f for f in spec.flags if f.startswith(partial)), None)
+        if match is not None:
+            return _replace_tail(value, partial, match)
         return None
 
     async def _complete_dynamic(self, value: str, arg_type: str, partial: str) -> str | None:
@@ -473,10 +592,9 @@ class CommandSuggester(Suggester):
             return None
 
         if partial:
-            matches = [opt for opt in options if opt.startswith(partial)]
-            if matches:
-                base = value.rsplit(partial, 1)[0]
-                return f"{base}{matches[0]}"
+            match = next((opt for opt in options if opt.startswith(partial)), None)
+            if match is not None:
+                return _replace_tail(value, partial, match)
         else:
             # Suggest first option
             return f"{value}{options[0]}"
@@ -594,8 +712,9 @@ class CommandCompletions:
             except Exception:
                 pass
 
+        partial_cf = partial.casefold()
         for agent in sorted(agents):
-            if agent.lower().startswith(partial.lower()):
+            if agent.casefold().startswith(partial_cf):
                 # Extract short description from agent name
                 parts = agent.split(":")
                 category = parts[0] if len(parts) > 1 else ""
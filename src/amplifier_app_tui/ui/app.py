@@ -5,12 +5,13 @@ The primary Textual application that hosts all UI components.
 
 from __future__ import annotations
 
+from collections import deque
 from typing import TYPE_CHECKING
 
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.containers import Container, Vertical
-from textual.widgets import Footer, Header, Static
+from textual.widgets import Footer, Header, RichLog, Static
 
 from ..core import EventBridge, RuntimeConfig, RuntimeManager
 
@@ -33,8 +34,12 @@ class StatusBar(Static):
             self.add_class(style)
 
 
-class MessageArea(Static):
-    """Area for displaying messages and output."""
+class MessageArea(RichLog):
+    """Area for displaying messages and output.
+
+    Each message is rendered once as it is appended, rather than re-rendering
+    the whole transcript on every message.
+    """
 
     DEFAULT_CSS = """
     MessageArea {
@@ -44,19 +49,22 @@ class MessageArea(Static):
     }
     """
 
-    def __init__(self) -> None:
-        super().__init__("")
-        self._content: list[str] = []
+    def __init__(self, max_lines: int | None = 2000) -> None:
+        """Initialize the message area.
+
+        Args:
+            max_lines: Maximum number of lines kept before the oldest are
+                discarded, or None to keep the whole session.
+        """
+        super().__init__(max_lines=max_lines, wrap=True)
 
     def append_message(self, message: str) -> None:
         """Append a message to the display."""
-        self._content.append(message)
-        self.update("\n".join(self._content))
+        self.write(message)
 
     def clear_messages(self) -> None:
         """Clear all messages."""
-        self._content.clear()
-        self.update("")
+        self.clear()
 
 
 class InputArea(Static):
@@ -149,6 +157,9 @@ class AmplifierTUI(App[None]):
         self._status_bar: StatusBar | None = None
         self._message_area: MessageArea | None = None
 
+        # Formatted events waiting for the next flush
+        self._event_queue: deque[str] = deque()
+
     def compose(self) -> ComposeResult:
         """Compose the UI layout."""
         yield Header()
@@ -167,8 +178,9 @@ class AmplifierTUI(App[None]):
         self._status_bar = self.query_one(StatusBar)
         self._message_area = self.query_one(MessageArea)
 
-        # Subscribe to events
+        # Subscribe to events, writing them out at most 30 times a second
         self._event_bridge.subscribe(self._handle_event)
+        self.set_interval(1 / 30, self._flush_events)
 
         # Start runtime connection
         self.run_worker(self._start_runtime())
@@ -185,18 +197,38 @@ class AmplifierTUI(App[None]):
                 self._status_bar.set_status(f"Connected ({mode})", "connected")
             if self._message_area:
                 self._message_area.append_message("Connected to Amplifier runtime")
+            self._watch_reconnect_failed()
         except Exception as e:
             if self._status_bar:
                 self._status_bar.set_status(f"Error: {e}", "error")
             if self._message_area:
                 self._message_area.append_message(f"Connection failed: {e}")
 
-    async def _handle_event(self, event: Event) -> None:
-        """Handle events from the runtime."""
+    def _watch_reconnect_failed(self) -> None:
+        """(Re)start watching for the runtime giving up on reconnection."""
+        self.run_worker(self._on_reconnect_failed(), group="reconnect-watch", exclusive=True)
+
+    async def _on_reconnect_failed(self) -> None:
+        """Show a terminal disconnected state once automatic reconnects stop."""
+        await self._runtime.reconnect_failed.wait()
+        if self._status_bar:
+            self._status_bar.set_status("Disconnected - press r to reconnect", "error")
         if self._message_area:
-            # Format event for display
-            event_str = f"[{event.type}] {event.data}"
-            self._message_area.append_message(event_str)
+            self._message_area.append_message(
+                "Lost connection to Amplifier runtime; automatic reconnect gave up"
+            )
+
+    async def _handle_event(self, event: Event) -> None:
+        """Queue events from the runtime for the next flush."""
+        self._event_queue.append(f"[{event.type}] {event.data}")
+
+    def _flush_events(self) -> None:
+        """Write all queued events to the message area in one update."""
+        if not self._event_queue or not self._message_area:
+            return
+        batch = "\n".join(self._event_queue)
+        self._event_queue.clear()
+        self._message_area.append_message(batch)
 
     async def action_quit(self) -> None:
         """Quit the application."""
@@ -210,8 +242,10 @@ class AmplifierTUI(App[None]):
         await self._runtime.restart()
         if self._status_bar:
             self._status_bar.set_status("Connected", "connected")
+        self._watch_reconnect_failed()
 
     def action_clear(self) -> None:
         """Clear the message area."""
+        self._event_queue.clear()
         if self._message_area:
             self._message_area.clear_messages()
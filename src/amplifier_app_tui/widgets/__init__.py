@@ -1,12 +1,35 @@
-"""Custom widgets for the Amplifier TUI."""
+"""Custom widgets for the Amplifier TUI.
 
-from .activity import ActivityItem, ActivityItemWidget, ActivityPanel
-from .approval import ApprovalPanel
-from .header import AgentHeader
-from .input import InputZone, PromptInput
-from .output import OutputZone
-from .status import StatusBar
-from .todos import TodoPanel
+Widgets are re-exported lazily: each submodule is imported on first access.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .activity import ActivityItem, ActivityItemWidget, ActivityPanel
+    from .approval import ApprovalPanel
+    from .header import AgentHeader
+    from .input import InputZone, PromptInput
+    from .output import OutputZone
+    from .status import StatusBar
+    from .todos import TodoPanel
+
+# Exported name -> submodule that defines it
+_LAZY = {
+    "ActivityItem": "activity",
+    "ActivityItemWidget": "activity",
+    "ActivityPanel": "activity",
+    "AgentHeader": "header",
+    "ApprovalPanel": "approval",
+    "InputZone": "input",
+    "OutputZone": "output",
+    "PromptInput": "input",
+    "StatusBar": "status",
+    "TodoPanel": "todos",
+}
 
 __all__ = [
     "ActivityItem",
@@ -20,3 +43,17 @@ __all__ = [
     "StatusBar",
     "TodoPanel",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -15,6 +15,7 @@ Layout:
 
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import TYPE_CHECKING
@@ -28,6 +29,9 @@ from textual.widgets import Static
 if TYPE_CHECKING:
     pass
 
+# Display order: running first, then pending, then finished
+_STATUS_ORDER = {"running": 0, "pending": 1, "success": 2, "error": 2}
+
 
 @dataclass
 class ActivityItem:
@@ -38,6 +42,7 @@ class ActivityItem:
     status: str = "pending"  # pending, running, success, error
     detail: str = ""  # Brief description (e.g., file path, command)
     started_at: datetime = field(default_factory=datetime.now)
+    started_at_mono: float = field(default_factory=time.monotonic)
     result_summary: str | None = None
     # For sub-sessions
     is_sub_session: bool = False
@@ -99,48 +104,59 @@ class ActivityItemWidget(Static):
     def __init__(self, item: ActivityItem, **kwargs) -> None:
         super().__init__(**kwargs)
         self.item = item
+        self._header = Static(self._render_header_text(), classes="activity-header")
+        self._last_detail = item.detail
+        self._detail = Static(self._render_detail_text(), classes="activity-detail")
+        self._detail.display = bool(item.detail)
 
     def compose(self) -> ComposeResult:
-        icon = self.ICONS.get(self.item.status, "○")
-        elapsed = self._get_elapsed()
+        yield self._header
+        yield self._detail
 
-        # Header: icon + name + status + time
+    def on_mount(self) -> None:
+        """Set status class."""
+        self.add_class(self.item.status)
+
+    def _render_header_text(self) -> str:
+        """Build the header line: icon + name + status + time."""
+        icon = self.ICONS.get(self.item.status, "○")
         status_text = self.item.status if self.item.status != "running" else ""
         if self.item.is_sub_session and self.item.agent_name:
             name = f"@{self.item.agent_name}"
         else:
             name = self.item.name
+        return f"{icon} {name} {status_text} {self._get_elapsed()}"
 
-        yield Static(f"{icon} {name} {status_text} {elapsed}", classes="activity-header")
-
-        # Detail line (truncated)
-        if self.item.detail:
-            detail = (
-                self.item.detail[:40] + "..." if len(self.item.detail) > 40 else self.item.detail
-            )
-            yield Static(f"  {detail}", classes="activity-detail")
-
-    def on_mount(self) -> None:
-        """Set status class."""
-        self.add_class(self.item.status)
+    def _render_detail_text(self) -> str:
+        """Build the (truncated) detail line."""
+        detail = self.item.detail
+        if len(detail) > 40:
+            detail = detail[:40] + "..."
+        return f"  {detail}"
 
     def _get_elapsed(self) -> str:
         """Get elapsed time string."""
-        elapsed = datetime.now() - self.item.started_at
-        seconds = int(elapsed.total_seconds())
+        seconds = int(time.monotonic() - self.item.started_at_mono)
         if seconds < 60:
             return f"{seconds}s"
         minutes = seconds // 60
         return f"{minutes}m{seconds % 60}s"
 
+    def refresh_elapsed(self) -> None:
+        """Re-render just the header so the elapsed time advances."""
+        self._header.update(self._render_header_text())
+
     def update_item(self, item: ActivityItem) -> None:
-        """Update the displayed item."""
+        """Update the displayed item in place."""
         self.item = item
         # Update classes
         self.remove_class("pending", "running", "success", "error")
         self.add_class(item.status)
-        # Re-render
-        self.refresh(recompose=True)
+        self._header.update(self._render_header_text())
+        if item.detail != self._last_detail:
+            self._last_detail = item.detail
+            self._detail.update(self._render_detail_text())
+            self._detail.display = bool(item.detail)
 
 
 class ActivityPanel(Vertical):
@@ -199,18 +215,46 @@ class ActivityPanel(Vertical):
     def __init__(self, **kwargs) -> None:
         super().__init__(**kwargs)
         self._activities: dict[str, ActivityItem] = {}
+        self._widgets: dict[str, ActivityItemWidget] = {}
+        self._refresh_scheduled = False
+        self._sorted_items: list[ActivityItem] = []
+        self._dirty_order = True
+        # Set in compose
+        self._header_widget: Static | None = None
+        self._content_widget: ScrollableContainer | None = None
+        self._empty_message: Static | None = None
 
     def compose(self) -> ComposeResult:
         count = len(self._activities)
-        yield Static(f"▼ Activity ({count})", classes="panel-header", id="activity-header")
-        with ScrollableContainer(classes="panel-content", id="activity-content"):
+        self._header_widget = Static(
+            f"▼ Activity ({count})", classes="panel-header", id="activity-header"
+        )
+        yield self._header_widget
+        self._content_widget = ScrollableContainer(classes="panel-content", id="activity-content")
+        with self._content_widget:
             if not self._activities:
-                yield Static("No activity", classes="empty-message")
+                self._empty_message = Static("No activity", classes="empty-message")
+                yield self._empty_message
+
+    def on_mount(self) -> None:
+        """Show activities added before mount and start the elapsed-time ticker."""
+        if self._activities:
+            self._schedule_refresh()
+        self.set_interval(1.0, self._tick_elapsed)
+
+    def _tick_elapsed(self) -> None:
+        """Advance the elapsed time of in-flight activities."""
+        if self.collapsed:
+            return
+        for widget in self._widgets.values():
+            if widget.item.status in ("pending", "running"):
+                widget.refresh_elapsed()
 
     def add_activity(self, item: ActivityItem) -> None:
         """Add a new activity to track."""
         self._activities[item.id] = item
-        self._update_display()
+        self._dirty_order = True
+        self._schedule_refresh()
 
     def update_activity(self, activity_id: str, **updates) -> None:
         """Update an existing activity."""
@@ -220,72 +264,103 @@ class ActivityPanel(Vertical):
                 if hasattr(item, key):
                     setattr(item, key, value)
 
+            if "status" in updates:
+                self._dirty_order = True
+
             # If completed, notify for summary in main chat
             if updates.get("status") in ("success", "error"):
                 self.post_message(self.ActivityCompleted(item))
 
-            self._update_display()
+            self._schedule_refresh()
 
     def remove_activity(self, activity_id: str) -> None:
         """Remove an activity (after completion)."""
         if activity_id in self._activities:
             del self._activities[activity_id]
-            self._update_display()
+            self._dirty_order = True
+            self._schedule_refresh()
 
     def clear_completed(self) -> None:
         """Remove all completed activities."""
         self._activities = {
             k: v for k, v in self._activities.items() if v.status not in ("success", "error")
         }
-        self._update_display()
+        self._dirty_order = True
+        self._schedule_refresh()
 
     def get_activity_count(self) -> int:
         """Get count of active (non-completed) activities."""
         return sum(1 for a in self._activities.values() if a.status in ("pending", "running"))
 
+    def _schedule_refresh(self) -> None:
+        """Schedule one display update for all mutations made this frame."""
+        if not self._refresh_scheduled:
+            self._refresh_scheduled = True
+            self.call_after_refresh(self._do_refresh)
+
+    def _do_refresh(self) -> None:
+        """Run the scheduled display update."""
+        self._refresh_scheduled = False
+        self._update_display()
+
     def _update_display(self) -> None:
         """Update the panel display."""
-        # Update header count
-        try:
-            header = self.query_one("#activity-header", Static)
-            count = len(self._activities)
-            icon = "▶" if self.collapsed else "▼"
-            header.update(f"{icon} Activity ({count})")
-        except Exception:
-            pass
-
-        # Update content
-        try:
-            content = self.query_one("#activity-content", ScrollableContainer)
-            content.remove_children()
-
-            if not self._activities:
-                content.mount(Static("No activity", classes="empty-message"))
+        header = self._header_widget
+        content = self._content_widget
+        if header is None or content is None:
+            return
+
+        icon = "▶" if self.collapsed else "▼"
+        header.update(f"{icon} Activity ({len(self._activities)})")
+
+        # Update content: mount new items, drop finished ones, update the rest
+        for activity_id in self._widgets.keys() - self._activities.keys():
+            self._widgets.pop(activity_id).remove()
+
+        if not self._activities:
+            if self._empty_message is None:
+                self._empty_message = Static("No activity", classes="empty-message")
+                content.mount(self._empty_message)
+            return
+        if self._empty_message is not None:
+            self._empty_message.remove()
+            self._empty_message = None
+
+        if not self._dirty_order:
+            for item in self._sorted_items:
+                self._widgets[item.id].update_item(item)
+            return
+
+        # Sort: running first, then pending, then by start time
+        sorted_items = sorted(
+            self._activities.values(),
+            key=lambda x: (_STATUS_ORDER.get(x.status, 2), x.started_at_mono),
+        )
+        for item in sorted_items:
+            widget = self._widgets.get(item.id)
+            if widget is None:
+                widget = ActivityItemWidget(item, id=f"activity-{item.id}")
+                self._widgets[item.id] = widget
+                content.mount(widget)
             else:
-                # Sort: running first, then pending, then by start time
-                sorted_items = sorted(
-                    self._activities.values(),
-                    key=lambda x: (
-                        0 if x.status == "running" else 1 if x.status == "pending" else 2,
-                        x.started_at,
-                    ),
-                )
-                for item in sorted_items:
-                    content.mount(ActivityItemWidget(item, id=f"activity-{item.id}"))
-        except Exception:
-            pass
+                widget.update_item(item)
+
+        # Move only the widgets that are out of place
+        children = content.children
+        for index, item in enumerate(sorted_items):
+            widget = self._widgets[item.id]
+            if children[index] is not widget:
+                content.move_child(widget, before=index)
+        self._sorted_items = sorted_items
+        self._dirty_order = False
 
     def toggle_collapse(self) -> None:
         """Toggle panel visibility."""
         self.collapsed = not self.collapsed
         self.toggle_class("collapsed")
-        self._update_display()
+        self._schedule_refresh()
 
     def on_click(self, event) -> None:
         """Handle click on header to toggle."""
-        try:
-            header = self.query_one("#activity-header", Static)
-            if event.widget == header:
-                self.toggle_collapse()
-        except Exception:
-            pass
+        if self._header_widget is not None and event.widget == self._header_widget:
+            self.toggle_collapse()
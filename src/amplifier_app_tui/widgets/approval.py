@@ -7,6 +7,14 @@ from textual.containers import Container, Vertical
 from textual.widgets import Static
 
 
+def _one_line(value: object, limit: int = 100) -> str:
+    """Render a value on one line, truncated to at most ``limit`` characters."""
+    text = str(value).replace("\n", "\\n")
+    if len(text) > limit:
+        return text[: limit - 3] + "..."
+    return text
+
+
 class ApprovalPanel(Container):
     """Modal overlay for approval requests.
 
@@ -91,30 +99,44 @@ class ApprovalPanel(Container):
         super().__init__(**kwargs)
         self._tool_name = ""
         self._params: dict = {}
+        # Dialog contents are mounted on first show
+        self._tool_static: Static | None = None
+        self._params_static: Static | None = None
 
     def compose(self) -> ComposeResult:
-        with Vertical(id="approval-dialog"):
-            yield Static("⚠ Approval Required", id="approval-header")
-            yield Static("Tool: ", id="approval-tool")
-            yield Static("Parameters:", id="approval-params-header")
-            yield Static("", id="approval-params")
-            yield Static(
-                "[Y] Approve          [N] Deny",
-                id="approval-actions",
-                classes="action-hint",
+        yield Vertical(id="approval-dialog")
+
+    def _mount_dialog(self) -> tuple[Static, Static]:
+        """Mount the dialog contents, returning the tool and params Statics."""
+        if self._tool_static is None or self._params_static is None:
+            self._tool_static = Static("Tool: ", id="approval-tool")
+            self._params_static = Static("", id="approval-params")
+            self.query_one("#approval-dialog", Vertical).mount_all(
+                [
+                    Static("⚠ Approval Required", id="approval-header"),
+                    self._tool_static,
+                    Static("Parameters:", id="approval-params-header"),
+                    self._params_static,
+                    Static(
+                        "[Y] Approve          [N] Deny",
+                        id="approval-actions",
+                        classes="action-hint",
+                    ),
+                ]
             )
+        return self._tool_static, self._params_static
 
     def show_approval(self, tool: str, params: dict) -> None:
         """Show the approval panel with tool details."""
         self._tool_name = tool
         self._params = params
+        tool_static, params_static = self._mount_dialog()
 
         # Update tool name
-        self.query_one("#approval-tool", Static).update(f"Tool: [bold]{tool}[/bold]")
+        tool_static.update(f"Tool: [bold]{tool}[/bold]")
 
         # Format parameters
-        params_text = self._format_params(params)
-        self.query_one("#approval-params", Static).update(params_text)
+        params_static.update(self._format_params(params))
 
         # Show panel
         self.add_class("visible")
@@ -130,18 +152,7 @@ class ApprovalPanel(Container):
         if not params:
             return "(no parameters)"
 
-        lines = []
-        for key, value in params.items():
-            value_str = str(value)
-            # Truncate long values
-            if len(value_str) > 100:
-                value_str = value_str[:97] + "..."
-            # Handle multi-line values
-            if "\n" in value_str:
-                value_str = value_str.replace("\n", "\\n")[:100] + "..."
-            lines.append(f"{key}: {value_str}")
-
-        return "\n".join(lines)
+        return "\n".join(f"{name}: {_one_line(value)}" for name, value in params.items())
 
     @property
     def is_visible(self) -> bool:
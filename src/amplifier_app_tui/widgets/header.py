@@ -9,6 +9,8 @@ Design principles (from TUI research):
 
 from __future__ import annotations
 
+import functools
+
 from textual.app import ComposeResult
 from textual.containers import Horizontal
 from textual.reactive import reactive
@@ -29,6 +31,13 @@ class AgentBreadcrumb(Static):
         self.agents = agents if agents else ["amplifier"]
 
 
+def _render_states(
+    icons: dict[str, str], colors: dict[str, str], labels: dict[str, str]
+) -> dict[str, str]:
+    """Build the indicator markup for each state, looked up by state name."""
+    return {s: f"[{colors[s]}]{icons[s]} {labels[s]}[/{colors[s]}]" for s in icons}
+
+
 class AgentStateIndicator(Static):
     """Shows agent state with semantic icons.
 
@@ -73,19 +82,28 @@ class AgentStateIndicator(Static):
         "error": "Error",
     }
 
+    # Markup for every known state, built once
+    RENDERED = _render_states(ICONS, COLORS, LABELS)
+    RENDERED_UNKNOWN = "[white]○ Unknown[/white]"
+
     state: reactive[str] = reactive("idle", init=False)
 
     def render(self) -> str:
-        icon = self.ICONS.get(self.state, "○")
-        color = self.COLORS.get(self.state, "white")
-        label = self.LABELS.get(self.state, "Unknown")
-        return f"[{color}]{icon} {label}[/{color}]"
+        return self.RENDERED.get(self.state, self.RENDERED_UNKNOWN)
 
     def set_state(self, state: str) -> None:
         """Update agent state."""
         self.state = state
 
 
+@functools.lru_cache(maxsize=8)
+def _connection_markup(connected: bool, mode: str) -> str:
+    """Build the connection indicator markup for a state/mode pair."""
+    if connected:
+        return f"[green]● Connected[/green] │ [dim]{mode}[/dim]"
+    return f"[red]○ Disconnected[/red] │ [dim]{mode}[/dim]"
+
+
 class ConnectionIndicator(Static):
     """Shows connection status and transport mode.
 
@@ -97,10 +115,7 @@ class ConnectionIndicator(Static):
     mode: reactive[str] = reactive("stdio", init=False)
 
     def render(self) -> str:
-        if self.connected:
-            return f"[green]● Connected[/green] │ [dim]{self.mode}[/dim]"
-        else:
-            return f"[red]○ Disconnected[/red] │ [dim]{self.mode}[/dim]"
+        return _connection_markup(self.connected, self.mode)
 
     def update_state(self, connected: bool, mode: str) -> None:
         """Update connection state."""
@@ -147,23 +162,30 @@ class AgentHeader(Static):
     }
     """
 
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        # Children are kept so updates don't need a DOM query
+        self._breadcrumb = AgentBreadcrumb(id="agent-breadcrumb")
+        self._state_indicator = AgentStateIndicator(id="agent-state")
+        self._connection = ConnectionIndicator(id="connection-indicator")
+
     def compose(self) -> ComposeResult:
         with Horizontal(id="header-content"):
-            yield AgentBreadcrumb(id="agent-breadcrumb")
-            yield AgentStateIndicator(id="agent-state")
-            yield ConnectionIndicator(id="connection-indicator")
+            yield self._breadcrumb
+            yield self._state_indicator
+            yield self._connection
 
     def update_agents(self, agents: list[str]) -> None:
         """Update agent breadcrumb."""
-        self.query_one("#agent-breadcrumb", AgentBreadcrumb).update_agents(agents)
+        self._breadcrumb.update_agents(agents)
 
     def update_agent_state(self, state: str) -> None:
         """Update agent state indicator."""
-        self.query_one("#agent-state", AgentStateIndicator).set_state(state)
+        self._state_indicator.set_state(state)
 
     def update_connection(self, connected: bool, mode: str) -> None:
         """Update connection indicator."""
-        self.query_one("#connection-indicator", ConnectionIndicator).update_state(connected, mode)
+        self._connection.update_state(connected, mode)
 
     def update_state(
         self,
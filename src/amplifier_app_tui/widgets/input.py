@@ -9,8 +9,9 @@ Supports:
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
+from textual import events
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Horizontal
@@ -20,6 +21,12 @@ from textual.reactive import reactive
 from textual.widgets import Input, Static
 from textual_autocomplete import AutoComplete, DropdownItem, TargetState
 
+# Delay before rebuilding the dropdown after the input changes
+_REBUILD_DELAY = 0.075
+
+# Keys that act on the dropdown, so it must be current when they arrive
+_DROPDOWN_KEYS = frozenset({"up", "down", "enter", "tab", "escape"})
+
 
 class SmartAutoComplete(AutoComplete):
     """AutoComplete that uses item.id for completion value instead of item.main.
@@ -28,8 +35,51 @@ class SmartAutoComplete(AutoComplete):
 
     This allows displaying rich text (command + description) while only
     inserting the command/agent name on Tab.
+
+    Dropdown rebuilds are debounced so a burst of typing rebuilds once.
     """
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._rebuild_timer: Timer | None = None
+        self._rebuild_visibility = False
+
+    def _handle_target_update(self) -> None:
+        """Schedule a rebuild that also decides dropdown visibility."""
+        self._schedule_rebuild(update_visibility=True)
+
+    def _align_and_rebuild(self) -> None:
+        """Schedule a rebuild after the cursor or selection moved."""
+        self._schedule_rebuild(update_visibility=False)
+
+    def _schedule_rebuild(self, update_visibility: bool) -> None:
+        """Schedule a dropdown rebuild, replacing any pending one."""
+        self._rebuild_visibility |= update_visibility
+        if self._rebuild_timer is not None:
+            self._rebuild_timer.stop()
+        self._rebuild_timer = self.set_timer(_REBUILD_DELAY, self._rebuild_now)
+
+    def _rebuild_now(self) -> None:
+        """Run the pending dropdown rebuild."""
+        if self._rebuild_timer is not None:
+            self._rebuild_timer.stop()
+            self._rebuild_timer = None
+        if self._rebuild_visibility:
+            self._rebuild_visibility = False
+            super()._handle_target_update()
+        else:
+            super()._align_and_rebuild()
+
+    def _listen_to_messages(self, event: events.Event) -> None:
+        """Bring the dropdown up to date before handling navigation keys."""
+        if (
+            self._rebuild_timer is not None
+            and isinstance(event, events.Key)
+            and event.key in _DROPDOWN_KEYS
+        ):
+            self._rebuild_now()
+        super()._listen_to_messages(event)
+
     def _align_to_target(self) -> None:
         """Override to position dropdown ABOVE the cursor instead of below.
 
@@ -77,6 +127,8 @@ class SmartAutoComplete(AutoComplete):
 
 
 if TYPE_CHECKING:
+    from textual.timer import Timer
+
     from ..completions import CompletionProvider
 
 
@@ -0,0 +1,98 @@
+"""Pilot tests for ActivityPanel's incremental widget updates."""
+
+from textual.app import App, ComposeResult
+from textual.containers import ScrollableContainer
+
+from amplifier_app_tui.widgets.activity import ActivityItem, ActivityItemWidget, ActivityPanel
+
+
+class PanelApp(App):
+    """Minimal app hosting a single ActivityPanel."""
+
+    def compose(self) -> ComposeResult:
+        yield ActivityPanel(id="panel")
+
+
+def shown(app: PanelApp) -> list[str]:
+    """Ids of the activity widgets in display order (or the empty-state marker)."""
+    content = app.query_one("#activity-content", ScrollableContainer)
+    return [
+        child.id if isinstance(child, ActivityItemWidget) else "<empty>"
+        for child in content.children
+    ]
+
+
+class TestActivityPanelDisplay:
+    """Test mounting, ordering and removal of activity widgets."""
+
+    async def test_insertion_order(self):
+        """Items with the same status should be shown in the order they started."""
+        app = PanelApp()
+        async with app.run_test() as pilot:
+            panel = app.query_one(ActivityPanel)
+            assert shown(app) == ["<empty>"]
+
+            for activity_id in ("a", "b", "c"):
+                panel.add_activity(ActivityItem(id=activity_id, name=activity_id))
+            await pilot.pause()
+
+            assert shown(app) == ["activity-a", "activity-b", "activity-c"]
+
+    async def test_status_change_reorders_and_keeps_widgets(self):
+        """Running items should move first, reusing their existing widgets."""
+        app = PanelApp()
+        async with app.run_test() as pilot:
+            panel = app.query_one(ActivityPanel)
+            for activity_id in ("a", "b", "c"):
+                panel.add_activity(ActivityItem(id=activity_id, name=activity_id))
+            await pilot.pause()
+            widget_c = app.query_one("#activity-c", ActivityItemWidget)
+
+            panel.update_activity("c", status="running")
+            await pilot.pause()
+            assert shown(app) == ["activity-c", "activity-a", "activity-b"]
+            assert app.query_one("#activity-c", ActivityItemWidget) is widget_c
+            assert widget_c.has_class("running")
+
+            panel.update_activity("c", status="success")
+            panel.update_activity("a", status="running")
+            await pilot.pause()
+            assert shown(app) == ["activity-a", "activity-b", "activity-c"]
+
+    async def test_removal(self):
+        """Removed items should be unmounted; removing all shows the empty state."""
+        app = PanelApp()
+        async with app.run_test() as pilot:
+            panel = app.query_one(ActivityPanel)
+            for activity_id in ("a", "b", "c"):
+                panel.add_activity(ActivityItem(id=activity_id, name=activity_id))
+            await pilot.pause()
+
+            panel.remove_activity("b")
+            await pilot.pause()
+            assert shown(app) == ["activity-a", "activity-c"]
+
+            panel.update_activity("a", status="success")
+            panel.clear_completed()
+            panel.remove_activity("c")
+            await pilot.pause()
+            assert shown(app) == ["<empty>"]
+
+    async def test_readd_after_removal(self):
+        """An id can be added again after its widget was removed."""
+        app = PanelApp()
+        async with app.run_test() as pilot:
+            panel = app.query_one(ActivityPanel)
+            panel.add_activity(ActivityItem(id="a", name="bash"))
+            panel.add_activity(ActivityItem(id="b", name="grep"))
+            await pilot.pause()
+
+            panel.remove_activity("a")
+            await pilot.pause()
+            assert shown(app) == ["activity-b"]
+
+            panel.add_activity(ActivityItem(id="a", name="bash", status="running"))
+            await pilot.pause()
+
+            assert shown(app) == ["activity-a", "activity-b"]
+            assert app.query_one("#activity-a", ActivityItemWidget).item.status == "running"
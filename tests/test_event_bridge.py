@@ -0,0 +1,241 @@
+"""Tests for EventBridge subscription and dispatch."""
+
+import asyncio
+import functools
+from dataclasses import dataclass, field
+
+import pytest
+
+pytest.importorskip("amplifier_app_runtime")
+
+from amplifier_app_tui.core.event_bridge import EventBridge  # noqa: E402
+
+
+@dataclass
+class FakeEvent:
+    """Minimal stand-in for a runtime Event."""
+
+    type: str
+    data: dict = field(default_factory=dict)
+
+
+def recorder(log: list, name: str):
+    """Create a sync callback that records (name, event type)."""
+
+    def callback(event: FakeEvent) -> None:
+        log.append((name, event.type))
+
+    return callback
+
+
+# =============================================================================
+# Filtering
+# =============================================================================
+
+
+class TestDelivery:
+    """Test routing by event type, session and catch-all."""
+
+    async def test_type_session_and_catch_all(self):
+        """Each subscriber should get exactly the events its filters match."""
+        bridge = EventBridge()
+        log: list = []
+        bridge.subscribe(recorder(log, "all"))
+        bridge.subscribe(recorder(log, "delta"), event_types={"content.delta"})
+        bridge.subscribe(recorder(log, "s1"), session_id="s1")
+        bridge.subscribe(recorder(log, "delta@s2"), event_types={"content.delta"}, session_id="s2")
+
+        await bridge._dispatch(FakeEvent("content.delta", {"session_id": "s1"}))
+        await bridge._dispatch(FakeEvent("content.delta", {"session_id": "s2"}))
+        await bridge._dispatch(FakeEvent("tool.call", {"session_id": "s1"}))
+        await bridge._dispatch(FakeEvent("tool.call", {}))
+
+        assert sorted(log) == sorted(
+            [
+                ("all", "content.delta"),
+                ("delta", "content.delta"),
+                ("s1", "content.delta"),
+                ("all", "content.delta"),
+                ("delta", "content.delta"),
+                ("delta@s2", "content.delta"),
+                ("all", "tool.call"),
+                ("s1", "tool.call"),
+                ("all", "tool.call"),
+            ]
+        )
+
+    async def test_subscribers_called_in_subscription_order(self):
+        """Subscribers in the same bucket should run in the order they subscribed."""
+        bridge = EventBridge()
+        log: list = []
+        for name in ("a", "b", "c"):
+            bridge.subscribe(recorder(log, name), event_types={"x"})
+
+        await bridge._dispatch(FakeEvent("x"))
+        await bridge._dispatch(FakeEvent("x"))
+
+        assert [name for name, _ in log] == ["a", "b", "c", "a", "b", "c"]
+
+    async def test_async_subscribers_run_concurrently(self):
+        """A slow async subscriber should not hold up the others."""
+        bridge = EventBridge()
+        released = asyncio.Event()
+
+        async def waiter(event: FakeEvent) -> None:
+            await released.wait()
+
+        async def releaser(event: FakeEvent) -> None:
+            released.set()
+
+        bridge.subscribe(waiter)
+        bridge.subscribe(releaser)
+
+        await asyncio.wait_for(bridge._dispatch(FakeEvent("x")), timeout=1.0)
+
+    async def test_sync_callables_returning_coroutines_are_awaited(self):
+        """A lambda or partial wrapping an async function should still be awaited."""
+        bridge = EventBridge()
+        log: list = []
+
+        async def handle(name: str, event: FakeEvent) -> None:
+            log.append((name, event.type))
+
+        bridge.subscribe(lambda event: handle("lambda", event))
+        bridge.subscribe(functools.partial(handle, "partial"))
+
+        await bridge._dispatch(FakeEvent("x"))
+
+        assert sorted(log) == [("lambda", "x"), ("partial", "x")]
+
+
+# =============================================================================
+# Unsubscribe
+# =============================================================================
+
+
+class TestUnsubscribe:
+    """Test removing subscriptions."""
+
+    async def test_unsubscribe_by_subscription(self):
+        """Removing one subscription should leave the callback's others in place."""
+        bridge = EventBridge()
+        log: list = []
+        callback = recorder(log, "cb")
+        sub_x = bridge.subscribe(callback, event_types={"x"})
+        bridge.subscribe(callback, event_types={"y"})
+
+        assert bridge.unsubscribe(sub_x)
+        assert not bridge.unsubscribe(sub_x)
+        await bridge._dispatch(FakeEvent("x"))
+        await bridge._dispatch(FakeEvent("y"))
+
+        assert log == [("cb", "y")]
+
+    async def test_unsubscribe_by_callback_removes_all(self):
+        """Removing by callback should drop every subscription made with it."""
+        bridge = EventBridge()
+        log: list = []
+        callback = recorder(log, "cb")
+        bridge.subscribe(callback, event_types={"x"})
+        bridge.subscribe(callback, session_id="s1")
+
+        assert bridge.unsubscribe(callback)
+        assert not bridge.unsubscribe(callback)
+        await bridge._dispatch(FakeEvent("x", {"session_id": "s1"}))
+
+        assert log == []
+
+    async def test_unsubscribe_during_dispatch(self):
+        """Unsubscribing mid-dispatch should take effect from the next event."""
+        bridge = EventBridge()
+        log: list = []
+        second = recorder(log, "second")
+
+        def first(event: FakeEvent) -> None:
+            log.append(("first", event.type))
+            bridge.unsubscribe(second)
+
+        bridge.subscribe(first)
+        bridge.subscribe(second)
+
+        await bridge._dispatch(FakeEvent("x"))
+        await bridge._dispatch(FakeEvent("y"))
+
+        assert log == [("first", "x"), ("second", "x"), ("first", "y")]
+
+
+# =============================================================================
+# Errors
+# =============================================================================
+
+
+class TestSubscriberErrors:
+    """Test that a failing subscriber doesn't affect the others."""
+
+    async def test_raising_subscribers_are_isolated(self, caplog):
+        """Sync and async subscribers that raise should be logged, not propagated."""
+        bridge = EventBridge()
+        log: list = []
+
+        def bad_sync(event: FakeEvent) -> None:
+            raise ValueError("sync boom")
+
+        async def bad_async(event: FakeEvent) -> None:
+            raise ValueError("async boom")
+
+        bridge.subscribe(bad_sync)
+        bridge.subscribe(bad_async)
+        bridge.subscribe(recorder(log, "ok"))
+
+        await bridge._dispatch(FakeEvent("x"))
+
+        assert log == [("ok", "x")]
+        messages = [r.getMessage() for r in caplog.records]
+        assert any("sync boom" in m for m in messages)
+        assert any("async boom" in m for m in messages)
+
+    async def test_cancelled_subscriber_is_logged(self, caplog):
+        """An async subscriber raising CancelledError should be logged like any failure."""
+        bridge = EventBridge()
+        log: list = []
+
+        async def cancelled(event: FakeEvent) -> None:
+            raise asyncio.CancelledError
+
+        bridge.subscribe(cancelled)
+        bridge.subscribe(recorder(log, "ok"))
+
+        await bridge._dispatch(FakeEvent("x"))
+
+        assert log == [("ok", "x")]
+        assert any("CancelledError" in r.getMessage() for r in caplog.records)
+
+
+# =============================================================================
+# Listening
+# =============================================================================
+
+
+class TestListenLoop:
+    """Test the client event stream loop."""
+
+    async def test_stream_end_dispatches_and_reports_disconnect(self):
+        """Events from the stream should be dispatched, then on_disconnect called."""
+
+        class FakeEventStream:
+            async def subscribe(self):
+                yield FakeEvent("a")
+                yield FakeEvent("b")
+
+        class FakeClient:
+            event = FakeEventStream()
+
+        bridge = EventBridge()
+        log: list = []
+        bridge.subscribe(recorder(log, "all"))
+        disconnected = asyncio.Event()
+
+        bridge.start(FakeClient(), on_disconnect=disconnected.set)
+        await asyncio.wait_for(disconnected.wait(), timeout=1.0)
+
+        assert log == [("all", "a"), ("all", "b")]
@@ -0,0 +1,84 @@
+"""Pilot tests for the prompt input's debounced autocomplete dropdown."""
+
+from textual.app import App, ComposeResult
+
+from amplifier_app_tui.widgets.input import InputZone, PromptInput, SmartAutoComplete
+
+
+class InputApp(App):
+    """Minimal app hosting an InputZone with its static command completions."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.submitted: list[str] = []
+
+    def compose(self) -> ComposeResult:
+        yield InputZone()
+
+    def on_input_zone_prompt_submitted(self, event: InputZone.PromptSubmitted) -> None:
+        self.submitted.append(event.value)
+
+
+def option_ids(app: InputApp) -> list[str | None]:
+    """Ids (inserted commands) of the options currently in the dropdown."""
+    option_list = app.query_one(SmartAutoComplete).option_list
+    return [option_list.get_option_at_index(i).id for i in range(option_list.option_count)]
+
+
+class TestDebouncedDropdown:
+    """Test that debouncing never leaves the dropdown acting on stale items."""
+
+    async def test_fast_typing_matches_final_text(self):
+        """After a burst of typing the dropdown should reflect the final text."""
+        app = InputApp()
+        async with app.run_test() as pilot:
+            await pilot.press(*"/bundle l")
+            await pilot.pause(0.2)
+
+            assert app.query_one(SmartAutoComplete).display
+            assert option_ids(app) == ["/bundle list"]
+
+    async def test_fast_typing_rebuilds_once(self, monkeypatch):
+        """A burst of keystrokes should rebuild the dropdown once, not per key."""
+        rebuilds = 0
+        rebuild = SmartAutoComplete._rebuild_options
+
+        def counting(self, *args):
+            nonlocal rebuilds
+            rebuilds += 1
+            return rebuild(self, *args)
+
+        monkeypatch.setattr(SmartAutoComplete, "_rebuild_options", counting)
+        app = InputApp()
+        async with app.run_test() as pilot:
+            await pilot.pause(0.2)
+            rebuilds = 0
+            await pilot.press(*"/bundle")
+            await pilot.pause(0.2)
+
+            assert rebuilds == 1
+
+    async def test_tab_during_debounce_completes_current_text(self):
+        """Tab straight after typing should complete against the typed text."""
+        app = InputApp()
+        async with app.run_test() as pilot:
+            await pilot.press(*"/bundle l", "tab")
+
+            assert app.query_one(PromptInput).value == "/bundle list"
+
+    async def test_down_during_debounce_uses_current_items(self):
+        """Navigating straight after typing should move through up-to-date items."""
+        app = InputApp()
+        async with app.run_test() as pilot:
+            await pilot.press(*"/bundle", "down", "tab")
+
+            assert app.query_one(PromptInput).value == "/bundle list"
+
+    async def test_enter_during_debounce_submits_final_text(self):
+        """Enter straight after typing should submit everything typed."""
+        app = InputApp()
+        async with app.run_test() as pilot:
+            await pilot.press(*"/bundle l", "enter")
+            await pilot.pause()
+
+            assert app.submitted == ["/bundle l"]
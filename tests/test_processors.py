@@ -4,6 +4,8 @@ Tests use realistic event data based on amplifier-core event structures
 as documented in amplifier-web's type definitions.
 """
 
+from unittest.mock import MagicMock
+
 import pytest
 
 from amplifier_app_tui.processors import (
@@ -298,6 +300,19 @@ class TestContentProcessor:
         processor.process("content_delta", {"index": 2, "delta": "thinking..."})
         assert processor.blocks[1].content == "thinking..."
 
+    def test_block_index_mapping_unusual_indices(self):
+        """None, negative and very large server indices should still map."""
+        processor = ContentProcessor()
+
+        for index in (None, -1, 10**9):
+            processor.process("content_start", {"block_type": "text", "index": index})
+        for local, index in enumerate((None, -1, 10**9)):
+            result = processor.process("content_delta", {"index": index, "delta": f"b{local}"})
+            assert result.handled
+
+        assert [b.content for b in processor.blocks] == ["b0", "b1", "b2"]
+        assert len(processor._state.block_index_list) == 0
+
 
 # =============================================================================
 # ToolProcessor Tests
@@ -510,6 +525,32 @@ class TestAgentProcessor:
         parent_id = processor.get_parent_tool_call_id("session_child_456")
         assert parent_id == "toolu_01ABC123"
 
+    def test_colon_and_underscore_event_names(self, session_fork_event):
+        """Should dispatch both 'session:end' and 'session_end' spellings."""
+        processor = AgentProcessor()
+        processor.process("session_fork", session_fork_event)
+
+        result = processor.process("session:end", {"session_id": "session_child_456"})
+        assert result.handled
+        assert result.data["parent_tool_call_id"] == "toolu_01ABC123"
+
+        assert processor.process("session:start", {"session_id": "main"}).handled
+        assert processor.get_state()["main_session_id"] == "main"
+
+        assert not processor.process("session:unknown", {}).handled
+
+    def test_active_count_tracks_status(self, session_fork_event):
+        """Should keep active_count in sync as sub-sessions start and end."""
+        processor = AgentProcessor()
+        processor.process("session_fork", session_fork_event)
+        assert processor.get_state()["active_count"] == 1
+
+        end = {"session_id": "session_child_456", "status": "complete"}
+        processor.process("session_end", end)
+        processor.process("session_end", end)  # Repeated end must not double-count
+        assert processor.get_state()["active_count"] == 0
+        assert not processor.has_active_sub_sessions
+
     def test_is_sub_session_event(self, session_fork_event):
         """Should detect sub-session events."""
         processor = AgentProcessor()
@@ -524,6 +565,12 @@ class TestAgentProcessor:
         # Event with nesting_depth
         assert processor.is_sub_session_event({"nesting_depth": 1})
 
+        # Explicit null depth is not a nesting signal, and must not mask other fields
+        assert not processor.is_sub_session_event({"nesting_depth": None})
+        assert processor.is_sub_session_event(
+            {"nesting_depth": None, "parent_tool_call_id": "toolu_01ABC123"}
+        )
+
         # Regular event
         assert not processor.is_sub_session_event({})
 
@@ -560,6 +607,26 @@ class TestApprovalProcessor:
         assert pending.tool_name == "bash"
         assert pending.timeout == 60
 
+    def test_fallback_keys_only_used_when_key_absent(self):
+        """Present-but-empty primary keys should win over their fallbacks."""
+        app = MagicMock()
+        processor = ApprovalProcessor(app)
+
+        processor.process(
+            "approval_request",
+            {"id": "a1", "tool_name": "", "tool": "bash", "params": {}, "arguments": {"x": 1}},
+        )
+        processor.process(
+            "approval_request",
+            {"approval_id": "a2", "tool": "bash", "arguments": {"x": 1}},
+        )
+
+        assert processor.get_pending("a1").tool_name == ""
+        assert processor.get_pending("a2").tool_name == "bash"
+        first, second = app.add_inline_approval.call_args_list
+        assert first.kwargs["params"] == {}
+        assert second.kwargs["params"] == {"x": 1}
+
     def test_resolve_approval(self, approval_request_event):
         """Should resolve and remove pending approval."""
         processor = ApprovalProcessor()
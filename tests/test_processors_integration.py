@@ -3,6 +3,7 @@
 Tests verify that processors correctly call app methods with expected arguments.
 """
 
+import asyncio
 from unittest.mock import MagicMock
 
 import pytest
@@ -69,6 +70,31 @@ class TestContentProcessorAppIntegration:
 
         mock_app.append_content.assert_called_with("Hello world")
 
+    def test_rapid_deltas_are_coalesced(self, mock_app):
+        """Fast deltas should reach the app in fewer calls, all text intact."""
+        processor = ContentProcessor(mock_app)
+        processor.process("content_start", {"block_type": "text", "index": 0})
+
+        for i in range(20):
+            processor.process("content_delta", {"index": 0, "delta": f"{i},"})
+        processor.process("content_end", {"index": 0})
+
+        calls = mock_app.append_content.call_args_list
+        assert len(calls) < 20
+        assert "".join(c.args[0] for c in calls) == "".join(f"{i}," for i in range(20))
+
+    async def test_paused_stream_flushes_tail(self, mock_app):
+        """Buffered deltas should reach the app even if no further event arrives."""
+        processor = ContentProcessor(mock_app)
+        processor.process("content_start", {"block_type": "text", "index": 0})
+
+        for delta in ("Hello", " wor", "ld"):
+            processor.process("content_delta", {"index": 0, "delta": delta})
+        await asyncio.sleep(0.1)
+
+        calls = mock_app.append_content.call_args_list
+        assert "".join(c.args[0] for c in calls) == "Hello world"
+
     def test_thinking_calls_add_thinking(self, mock_app):
         """Thinking delta should call app.add_thinking."""
         processor = ContentProcessor(mock_app)
@@ -0,0 +1,303 @@
+"""Tests for RuntimeManager reconnection and keep-alive behavior.
+
+The SDK client is replaced by a small fake so no runtime process or server
+is needed.
+"""
+
+import asyncio
+import random
+
+import pytest
+
+pytest.importorskip("amplifier_app_runtime")
+
+from amplifier_app_tui.core import runtime_manager  # noqa: E402
+from amplifier_app_tui.core.runtime_manager import (  # noqa: E402
+    ConnectionMode,
+    RuntimeConfig,
+    RuntimeManager,
+)
+
+# =============================================================================
+# Fakes
+# =============================================================================
+
+
+class FakeClient:
+    """Stand-in for TransportAmplifierClient."""
+
+    def __init__(self, error: Exception | None = None) -> None:
+        self.error = error
+        self.is_connected = False
+        self.connect_calls = 0
+
+    async def connect(self) -> None:
+        self.connect_calls += 1
+        if self.error is not None:
+            raise self.error
+        self.is_connected = True
+
+    async def disconnect(self) -> None:
+        self.is_connected = False
+
+
+class FakeTransport:
+    """Stand-in for a ClientTransport whose state changes go through _set_state."""
+
+    def __init__(self, client: FakeClient) -> None:
+        self.client = client
+
+    def _set_state(self, connected: bool) -> None:
+        self.client.is_connected = connected
+
+
+class TransportClient(FakeClient):
+    """Fake client that exposes a transport."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.transport = FakeTransport(self)
+
+
+def make_manager(monkeypatch, clients, **config) -> RuntimeManager:
+    """Create a manager whose _create_client hands out the given fake clients."""
+    config.setdefault("mode", ConnectionMode.MOCK)
+    manager = RuntimeManager(RuntimeConfig(**config))
+    created = iter(clients)
+    monkeypatch.setattr(manager, "_create_client", lambda: next(created))
+    return manager
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record backoff sleeps instead of waiting."""
+    recorded: list[float] = []
+
+    async def fake_sleep(delay: float) -> None:
+        recorded.append(delay)
+
+    monkeypatch.setattr(runtime_manager.asyncio, "sleep", fake_sleep)
+    return recorded
+
+
+# =============================================================================
+# Backoff
+# =============================================================================
+
+
+class TestReconnectBackoff:
+    """Test jittered exponential backoff and giving up."""
+
+    async def test_delays_stay_within_jitter_bounds(self, monkeypatch, sleeps):
+        """Each delay should fall in [base * (1 - jitter), base] with capped doubling."""
+        clients = [FakeClient(ConnectionError("down")) for _ in range(6)] + [FakeClient()]
+        manager = make_manager(
+            monkeypatch,
+            clients,
+            reconnect_delay=1.0,
+            max_reconnect_delay=4.0,
+            reconnect_jitter=0.5,
+            max_reconnect_attempts=None,
+        )
+        manager._rng = random.Random(1234)
+
+        await manager._attempt_reconnect()
+
+        bases = [1.0, 2.0, 4.0, 4.0, 4.0, 4.0]
+        assert len(sleeps) == len(bases)
+        for delay, base in zip(sleeps, bases, strict=True):
+            assert base * 0.5 <= delay <= base
+        assert manager.is_connected
+        assert not manager.reconnect_failed.is_set()
+
+    async def test_seeded_rng_is_deterministic(self, monkeypatch, sleeps):
+        """Two managers with the same seed should back off identically."""
+        runs = []
+        for _ in range(2):
+            clients = [FakeClient(ConnectionError("down")) for _ in range(3)] + [FakeClient()]
+            manager = make_manager(monkeypatch, clients, max_reconnect_attempts=None)
+            manager._rng = random.Random(42)
+            sleeps.clear()
+            await manager._attempt_reconnect()
+            runs.append(list(sleeps))
+
+        assert runs[0] == runs[1]
+
+    async def test_gives_up_after_max_attempts(self, monkeypatch, sleeps):
+        """Reconnection should stop after N failures and set reconnect_failed."""
+        clients = [FakeClient(ConnectionError("down")) for _ in range(10)]
+        manager = make_manager(monkeypatch, clients, max_reconnect_attempts=3)
+
+        await manager._attempt_reconnect()
+
+        assert manager.reconnect_failed.is_set()
+        # Three attempts, with a sleep between each pair
+        assert sum(c.connect_calls for c in clients) == 3
+        assert len(sleeps) == 2
+
+    async def test_unrecoverable_error_gives_up_immediately(self, monkeypatch, sleeps):
+        """A missing runtime binary should not be retried."""
+        clients = [FakeClient(FileNotFoundError("amplifier-runtime")), FakeClient()]
+        manager = make_manager(monkeypatch, clients, max_reconnect_attempts=None)
+
+        await manager._attempt_reconnect()
+
+        assert manager.reconnect_failed.is_set()
+        assert sleeps == []
+        assert not manager.is_connected
+
+
+# =============================================================================
+# Reconnect monitor
+# =============================================================================
+
+
+class TestReconnectMonitor:
+    """Test the event-driven reconnect loop and its done-callback."""
+
+    async def test_disconnect_notification_wakes_monitor(self, monkeypatch):
+        """notify_disconnected should trigger a reconnect without waiting for the poll."""
+        first, second = FakeClient(), FakeClient()
+        manager = make_manager(monkeypatch, [first, second], health_check_interval=60.0)
+        await manager.start()
+
+        first.is_connected = False
+        manager.notify_disconnected()
+        for _ in range(50):
+            if second.is_connected:
+                break
+            await asyncio.sleep(0.01)
+
+        assert second.is_connected
+        await manager.stop()
+
+    async def test_transport_state_change_wakes_monitor(self, monkeypatch):
+        """A transport state change should trigger a reconnect without waiting for the poll."""
+        first, second = TransportClient(), TransportClient()
+        manager = make_manager(monkeypatch, [first, second], health_check_interval=60.0)
+        await manager.start()
+
+        first.transport._set_state(False)
+        for _ in range(50):
+            if second.is_connected:
+                break
+            await asyncio.sleep(0.01)
+
+        assert second.is_connected
+        await manager.stop()
+
+    async def test_crashed_monitor_sets_reconnect_failed(self, monkeypatch):
+        """An unexpected error in the monitor should be surfaced via reconnect_failed."""
+        client = FakeClient()
+        manager = make_manager(monkeypatch, [client], health_check_interval=60.0)
+
+        async def boom() -> None:
+            raise RuntimeError("bug")
+
+        monkeypatch.setattr(manager, "_attempt_reconnect", boom)
+        await manager.start()
+
+        client.is_connected = False
+        manager.notify_disconnected()
+        await asyncio.wait_for(manager.reconnect_failed.wait(), timeout=1.0)
+
+        await manager.stop()
+
+
+# =============================================================================
+# Attach-mode HTTP client
+# =============================================================================
+
+
+class TestAttachHttpClient:
+    """Test that the shared HTTP client reaches the SDK's attach factory."""
+
+    def test_http_client_is_forwarded(self, monkeypatch):
+        """An attach factory that takes http_client should receive the shared client."""
+        received = []
+        shared = object()
+
+        def create_attach_client(base_url, timeout, http_client=None):
+            received.append(http_client)
+            return FakeClient()
+
+        monkeypatch.setattr(runtime_manager, "create_attach_client", create_attach_client)
+        manager = RuntimeManager(RuntimeConfig(mode=ConnectionMode.ATTACH))
+        monkeypatch.setattr(manager, "_get_http_client", lambda: shared)
+
+        manager._create_client()
+        manager._create_client()
+
+        assert received == [shared, shared]
+
+    def test_unsupported_factory_is_logged(self, monkeypatch, caplog):
+        """A factory without http_client should be called without it, and say so once."""
+        calls = []
+
+        def create_attach_client(base_url, timeout):
+            calls.append((base_url, timeout))
+            return FakeClient()
+
+        monkeypatch.setattr(runtime_manager, "create_attach_client", create_attach_client)
+        manager = RuntimeManager(RuntimeConfig(mode=ConnectionMode.ATTACH))
+
+        with caplog.at_level("DEBUG", logger=runtime_manager.__name__):
+            manager._create_client()
+            manager._create_client()
+
+        assert len(calls) == 2
+        assert sum("takes no http_client" in r.getMessage() for r in caplog.records) == 1
+
+
+# =============================================================================
+# Keep-alive pings
+# =============================================================================
+
+
+class PingingClient(FakeClient):
+    """Fake client that supports keep-alive pings."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.pings = 0
+
+    async def ping(self) -> None:
+        self.pings += 1
+
+
+class TestKeepalivePings:
+    """Test the attach-mode keep-alive ping loop."""
+
+    async def test_pings_connected_client(self, monkeypatch):
+        """A client with ping() should be pinged every interval."""
+        client = PingingClient()
+        manager = make_manager(
+            monkeypatch,
+            [client],
+            mode=ConnectionMode.ATTACH,
+            auto_reconnect=False,
+            keepalive_ping_interval=0.01,
+        )
+        await manager.start()
+        await asyncio.sleep(0.1)
+        await manager.stop()
+
+        assert client.pings >= 2
+
+    async def test_client_without_ping_disables_loop(self, monkeypatch, caplog):
+        """Without ping() the loop should stop and log why."""
+        manager = make_manager(
+            monkeypatch,
+            [FakeClient()],
+            mode=ConnectionMode.ATTACH,
+            auto_reconnect=False,
+            keepalive_ping_interval=0.01,
+        )
+        with caplog.at_level("INFO", logger=runtime_manager.__name__):
+            await manager.start()
+            task = manager._keepalive_task
+            assert task is not None
+            await asyncio.wait_for(task, timeout=1.0)
+
+        assert any("no ping()" in r.getMessage() for r in caplog.records)
+        await manager.stop()